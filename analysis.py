@@ -0,0 +1,519 @@
+"""Mesin analisis survei yang bisa dipakai tanpa Streamlit.
+
+Semua fungsi di sini murni (input DataFrame + nama kolom, output hasil).
+``AnalysisEngine`` membungkusnya dengan cache hasil yang dikunci
+``(fingerprint dataset, analisis, kolom, metode)``, sehingga berpindah ke
+variabel yang sudah pernah dilihat tidak menghitung ulang apa pun.
+"""
+import hashlib
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+from scipy.stats import fisher_exact, pearsonr, spearmanr
+
+from cache import LRUCache
+from column_profile import build_profiles, category_codes
+
+METHOD_PEARSON = "pearson"
+METHOD_SPEARMAN = "spearman"
+
+RESULT_CACHE_MAX_ENTRIES = 512
+
+# Batas elemen per batch saat menghitung tabel kontingensi semua pasangan
+# (baris x kolom untuk kunci, dan total sel tabel untuk hasil bincount)
+PAIR_BATCH_ELEMENTS = 1 << 24
+# Pasangan dengan tabel lebih besar dari ini dilewati di matriks Chi-Square
+MATRIX_MAX_CELLS = 1 << 20
+# Kolom non-numerik dengan kategori lebih banyak dari ini (ID, email, teks bebas)
+# tidak ikut pilihan bawaan matriks
+MATRIX_DEFAULT_MAX_LEVELS = 50
+
+# Tabel jarang: uji eksak/permutasi dipakai bila frekuensi harapan terlalu kecil
+SPARSE_EXPECTED_MIN = 5
+PERMUTATIONS = 10_000
+PERMUTATION_BATCH_ELEMENTS = 1 << 23
+# Batas kerja uji permutasi otomatis (permutasi x max(baris, sel tabel)), sekitar 1 detik;
+# bila hanya muat kurang dari PERMUTATIONS_MIN permutasi, p-value asimtotik yang dipakai
+PERMUTATION_MAX_WORK = 5 * 10 ** 7
+PERMUTATIONS_MIN = 1_000
+
+TEST_CHI2 = "chi2"
+TEST_FISHER = "fisher"
+TEST_PERMUTATION = "permutation"
+
+
+def dataset_fingerprint(df):
+    """Fingerprint isi DataFrame (untuk data yang tidak berasal dari upload)."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(list(df.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+# --- Fungsi analisis murni ---
+def coded_column(df, column, profiles=None):
+    """Kode integer dan label kategori kolom, dari indeks profil bila tersedia."""
+    profile = profiles.get(column) if profiles else None
+    if profile is not None and profile.has_codes:
+        return profile.codes, profile.categories
+    return category_codes(df[column])
+
+
+def describe_columns(df, columns):
+    """``describe()`` ditambah skew dan kurtosis untuk kolom numerik terpilih."""
+    columns = list(columns)
+    desc = df[columns].describe().T
+    desc["skew"] = df[columns].skew()
+    desc["kurtosis"] = df[columns].kurtosis()
+    return desc
+
+
+def paired_values(df, x1, x2):
+    """Nilai dua kolom pada baris yang keduanya tidak kosong."""
+    a = df[x1].to_numpy(dtype=float, na_value=np.nan)
+    b = df[x2].to_numpy(dtype=float, na_value=np.nan)
+    keep = ~(np.isnan(a) | np.isnan(b))
+    return a[keep], b[keep]
+
+
+def correlation(df, x1, x2, method=METHOD_PEARSON):
+    """Korelasi Pearson atau Spearman beserta p-value asimtotik."""
+    a, b = paired_values(df, x1, x2)
+    if method == METHOD_PEARSON:
+        coef, p = pearsonr(a, b)
+    elif method == METHOD_SPEARMAN:
+        coef, p = spearmanr(a, b)
+    else:
+        raise ValueError(f"Metode korelasi tidak dikenal: {method!r}")
+    return {"method": method, "coef": float(coef), "p": float(p), "n": int(len(a))}
+
+
+# --- Matriks asosiasi semua pasangan ---
+def _rank_columns(values):
+    # Ranking rata-rata per kolom; NaN tetap NaN
+    return pd.DataFrame(values).rank(axis=0, method="average").to_numpy(dtype=float)
+
+
+def correlation_pvalues(coef, n):
+    """P-value dua sisi uji t untuk koefisien korelasi dengan ``n`` pasangan data."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dof = n - 2
+        t = coef * np.sqrt(dof / (1.0 - coef * coef))
+        p = 2.0 * stats.t.sf(np.abs(t), dof)
+    p = np.where(np.abs(coef) == 1.0, 0.0, p)
+    p[n < 3] = np.nan
+    return p
+
+
+def correlation_matrix(df, columns, method=METHOD_PEARSON):
+    """Korelasi semua pasangan kolom numerik dalam satu lintasan matriks.
+
+    Nilai kosong ditangani per pasangan (pairwise complete). Untuk Spearman,
+    ranking dihitung sekali per kolom, jadi hasilnya eksak bila tidak ada nilai
+    kosong dan sangat dekat bila ada.
+    """
+    columns = list(columns)
+    values = df[columns].to_numpy(dtype=float, na_value=np.nan)
+    if method == METHOD_SPEARMAN:
+        values = _rank_columns(values)
+    elif method != METHOD_PEARSON:
+        raise ValueError(f"Metode korelasi tidak dikenal: {method!r}")
+    present = ~np.isnan(values)
+    # Pusatkan per kolom agar perkalian matriks stabil secara numerik
+    with np.errstate(invalid="ignore"):
+        centered = values - np.nanmean(values, axis=0)
+    z = np.where(present, centered, 0.0)
+    m = present.astype(float)
+    n = m.T @ m
+    sx = z.T @ m
+    sxx = (z * z).T @ m
+    sxy = z.T @ z
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = n * sxy - sx * sx.T
+        var = (n * sxx - sx * sx) * (n * sxx.T - sx.T * sx.T)
+        coef = np.clip(cov / np.sqrt(var), -1.0, 1.0)
+    coef[n < 2] = np.nan
+    p = correlation_pvalues(coef, n)
+    frame = lambda a: pd.DataFrame(a, index=columns, columns=columns)  # noqa: E731
+    return {"method": method, "coef": frame(coef), "p": frame(p), "n": frame(n.astype(np.int64))}
+
+
+def chi_square_from_counts(counts, correction=True):
+    """Chi-Square (dengan koreksi Yates untuk dof=1, seperti scipy) dari tabel hitungan."""
+    counts = counts[counts.sum(axis=1) > 0][:, counts.sum(axis=0) > 0]
+    total = counts.sum()
+    r, c = counts.shape
+    dof = (r - 1) * (c - 1)
+    expected = np.outer(counts.sum(axis=1), counts.sum(axis=0)) / max(total, 1)
+    if dof == 0 or total == 0:
+        return {"chi2": 0.0, "p": 1.0, "dof": int(dof), "cramers_v": np.nan, "n": int(total),
+                "expected": expected}
+    uncorrected = float(((counts - expected) ** 2 / expected).sum())
+    observed = counts.astype(float)
+    if correction and dof == 1:
+        diff = expected - observed
+        observed = observed + np.sign(diff) * np.minimum(0.5, np.abs(diff))
+    chi2 = float(((observed - expected) ** 2 / expected).sum())
+    cramers_v = np.sqrt(uncorrected / (total * min(r - 1, c - 1)))
+    return {
+        "chi2": chi2,
+        "p": float(stats.chi2.sf(chi2, dof)),
+        "dof": int(dof),
+        "cramers_v": float(cramers_v),
+        "n": int(total),
+        "expected": expected,
+    }
+
+
+def contingency_counts(codes1, codes2, k1, k2):
+    """Tabel kontingensi ``k1 x k2`` dari kode integer (kode -1 diabaikan)."""
+    valid = (codes1 >= 0) & (codes2 >= 0)
+    keys = codes1[valid].astype(np.int64) * k2 + codes2[valid]
+    return np.bincount(keys, minlength=k1 * k2).reshape(k1, k2)
+
+
+def is_sparse_table(expected):
+    """Aturan Cochran: ada harapan < 1 atau lebih dari 20% sel harapannya < 5."""
+    return bool(expected.min() < 1 or (expected < SPARSE_EXPECTED_MIN).mean() > 0.2)
+
+
+def permutation_chi2_pvalue(codes1, codes2, k1, k2, statistic, n_permutations=PERMUTATIONS, seed=None):
+    """P-value Monte-Carlo Chi-Square dengan mengacak ``codes2`` (margin tetap).
+
+    Permutasi diproses per batch: setiap batch satu ``np.bincount`` untuk
+    semua tabel hasil permutasi sekaligus. Ukuran batch dibatasi oleh yang
+    lebih besar dari jumlah baris dan jumlah sel tabel, karena keduanya
+    dialokasikan per permutasi.
+    """
+    rng = np.random.default_rng(seed)
+    n = len(codes1)
+    counts = contingency_counts(codes1, codes2, k1, k2)
+    expected = np.outer(counts.sum(axis=1), counts.sum(axis=0)) / n
+    cells = k1 * k2
+    # Margin tetap, jadi sum((O - E)^2 / E) = sum(O^2 / E) - n; bandingkan di skala sum(O^2 / E)
+    threshold = (statistic + n) * (1 - 1e-12)
+    inv_expected = (1.0 / expected).ravel()
+    batch = max(1, PERMUTATION_BATCH_ELEMENTS // max(n, cells, 1))
+    base = codes1.astype(np.int64) * k2
+    exceed = 0
+    done = 0
+    while done < n_permutations:
+        size = min(batch, n_permutations - done)
+        shuffled = rng.permuted(np.broadcast_to(codes2, (size, n)), axis=1)
+        keys = np.arange(size)[:, None] * cells + base + shuffled
+        del shuffled
+        tables = np.bincount(keys.ravel(), minlength=size * cells).reshape(size, cells)
+        del keys
+        # Kuadrat di tempat dan perkalian per baris: tanpa salinan float seukuran batch
+        np.square(tables, out=tables)
+        exceed += int((np.einsum("ij,j->i", tables, inv_expected) >= threshold).sum())
+        done += size
+    return (exceed + 1) / (n_permutations + 1)
+
+
+def permutation_count(n, cells, n_permutations=PERMUTATIONS):
+    """Jumlah permutasi yang muat dalam ``PERMUTATION_MAX_WORK``; 0 bila terlalu sedikit."""
+    count = min(n_permutations, PERMUTATION_MAX_WORK // max(n, cells, 1))
+    return int(count) if count >= min(PERMUTATIONS_MIN, n_permutations) else 0
+
+
+def crosstab_from_counts(counts, labels1, labels2, x1, x2):
+    """Hasil ``crosstab_chi2`` dari tabel hitungan ``k1 x k2`` beserta labelnya.
+
+    Baris/kolom kosong dibuang. Tabel jarang 2x2 diuji eksak Fisher; tabel
+    jarang yang lebih besar hanya ditandai ``sparse`` (uji permutasi butuh
+    data mentah, jadi diserahkan ke pemanggil).
+    """
+    rows, cols = counts.sum(axis=1) > 0, counts.sum(axis=0) > 0
+    counts = counts[rows][:, cols]
+    index = pd.Index(np.asarray(labels1, dtype=object)[rows], name=x1)
+    columns = pd.Index(np.asarray(labels2, dtype=object)[cols], name=x2)
+    result = chi_square_from_counts(counts)
+    expected = result.pop("expected")
+    result.update(
+        table=pd.DataFrame(counts, index=index, columns=columns),
+        expected=pd.DataFrame(expected, index=index, columns=columns),
+        p_asymptotic=result["p"],
+        sparse=False,
+        test=TEST_CHI2,
+    )
+    if result["dof"] > 0 and is_sparse_table(expected):
+        result["sparse"] = True
+        if counts.shape == (2, 2):
+            result["p"] = float(fisher_exact(counts).pvalue)
+            result["test"] = TEST_FISHER
+    return result
+
+
+def crosstab_chi2(df, x1, x2, profiles=None, n_permutations=PERMUTATIONS, seed=None):
+    """Tabel kontingensi dan uji Chi-Square untuk dua variabel kategorik.
+
+    Hitungan dibuat dengan ``np.bincount`` atas kode kategori. Bila tabel
+    jarang (aturan Cochran), p-value diambil dari uji eksak Fisher (2x2) atau
+    uji permutasi Monte-Carlo; p-value asimtotik tetap dilaporkan. Jumlah
+    permutasi dikurangi sesuai ukuran data (``permutation_count``); data yang
+    terlalu besar tetap memakai p-value asimtotik dengan tanda ``sparse``.
+    """
+    codes1, labels1 = coded_column(df, x1, profiles)
+    codes2, labels2 = coded_column(df, x2, profiles)
+    counts = contingency_counts(codes1, codes2, len(labels1), len(labels2))
+    result = crosstab_from_counts(counts, labels1, labels2, x1, x2)
+    if not result["sparse"] or result["test"] == TEST_FISHER:
+        return result
+    table, expected = result["table"].to_numpy(), result["expected"].to_numpy()
+    n_permutations = permutation_count(result["n"], table.size, n_permutations)
+    if not n_permutations:
+        return result
+    # Hanya baris dengan kedua kode terisi; kode ulang agar tabel tanpa sel kosong
+    rows, cols = counts.sum(axis=1) > 0, counts.sum(axis=0) > 0
+    valid = (codes1 >= 0) & (codes2 >= 0)
+    a = (np.cumsum(rows) - 1)[codes1[valid]]
+    b = (np.cumsum(cols) - 1)[codes2[valid]]
+    statistic = float(((table - expected) ** 2 / expected).sum())
+    result["p"] = float(permutation_chi2_pvalue(
+        a, b, table.shape[0], table.shape[1], statistic, n_permutations, seed))
+    result["test"] = TEST_PERMUTATION
+    result["permutations"] = n_permutations
+    return result
+
+
+def _pair_batches(cells, rows):
+    # Potong pasangan berurutan agar baris x kolom dan total sel per batch di bawah batas
+    per_batch = max(1, PAIR_BATCH_ELEMENTS // max(rows, 1))
+    start = 0
+    while start < len(cells):
+        stop, total = start + 1, cells[start]
+        while stop < len(cells) and stop - start < per_batch and total + cells[stop] <= PAIR_BATCH_ELEMENTS:
+            total += cells[stop]
+            stop += 1
+        yield start, stop
+        start = stop
+
+
+def matrix_default_columns(profiles, max_levels=MATRIX_DEFAULT_MAX_LEVELS):
+    """Kolom untuk matriks bila pengguna tidak memilih: tanpa kolom non-numerik berkardinalitas tinggi."""
+    return [name for name, profile in profiles.items()
+            if profile.is_numeric or profile.cardinality <= max_levels]
+
+
+def chi_square_matrix(df, columns, profiles=None):
+    """Uji Chi-Square untuk semua pasangan kolom kategorik.
+
+    Kolom diubah sekali menjadi kode integer; tabel kontingensi untuk satu
+    kolom terhadap banyak kolom lain dihitung dengan satu ``np.bincount``
+    per batch. Pasangan dengan tabel lebih dari ``MATRIX_MAX_CELLS`` sel
+    dilewati (statistik NaN, ditandai di ``skipped``).
+    """
+    columns = list(columns)
+    coded = [coded_column(df, c, profiles) for c in columns]
+    codes = np.column_stack([c for c, _ in coded]) if coded else np.empty((len(df), 0), np.int32)
+    sizes = np.array([len(labels) for _, labels in coded], dtype=np.int64)
+    keys = ("chi2", "p", "dof", "cramers_v", "n")
+    out = {key: np.full((len(columns), len(columns)), np.nan) for key in keys}
+    skipped = np.zeros((len(columns), len(columns)), dtype=bool)
+    for i in range(len(columns) - 1):
+        a = codes[:, i]
+        others = np.arange(i + 1, len(columns))
+        too_large = sizes[i] * sizes[others] > MATRIX_MAX_CELLS
+        for j in others[too_large]:
+            skipped[i, j] = skipped[j, i] = True
+            out["n"][i, j] = out["n"][j, i] = int(((a >= 0) & (codes[:, j] >= 0)).sum())
+        others = others[~too_large]
+        all_cells = sizes[i] * sizes[others]
+        for start, stop in _pair_batches(all_cells, len(a)):
+            js = others[start:stop]
+            cells = all_cells[start:stop]
+            offsets = np.concatenate([[0], np.cumsum(cells)[:-1]])
+            b = codes[:, js]
+            valid = (a >= 0)[:, None] & (b >= 0)
+            key = offsets + a[:, None] * sizes[js] + b
+            counts = np.bincount(key[valid], minlength=int(cells.sum()))
+            for j, offset, size in zip(js, offsets, cells):
+                table = counts[offset:offset + size].reshape(sizes[i], sizes[j])
+                result = chi_square_from_counts(table)
+                for name in keys:
+                    out[name][i, j] = out[name][j, i] = result[name]
+    frames = {name: pd.DataFrame(m, index=columns, columns=columns) for name, m in out.items()}
+    frames["skipped"] = pd.DataFrame(skipped, index=columns, columns=columns)
+    return frames
+
+
+# --- Numerik x Kategorik ---
+def group_comparison(df, num_col, cat_col, profiles=None):
+    """ANOVA satu arah, Kruskal-Wallis, eta kuadrat dan (untuk 2 grup) point-biserial.
+
+    Semua statistik grup (n, jumlah, jumlah kuadrat, jumlah ranking) dihitung
+    dengan ``np.bincount`` atas kode kategori, tanpa groupby per grup.
+    """
+    codes, labels = coded_column(df, cat_col, profiles)
+    k = len(labels)
+    values = df[num_col].to_numpy(dtype=float, na_value=np.nan)
+    keep = (codes >= 0) & ~np.isnan(values)
+    codes, values = codes[keep], values[keep]
+    counts = np.bincount(codes, minlength=k)
+    used = counts > 0
+    # Kode ulang agar hanya grup yang berisi data yang ikut dihitung
+    remap = np.cumsum(used) - 1
+    codes = remap[codes]
+    counts = counts[used]
+    groups = int(used.sum())
+    n = len(values)
+    labels = labels[used]
+    centered = values - values.mean() if n else values
+    sums = np.bincount(codes, weights=centered, minlength=groups)
+    sumsq = np.bincount(codes, weights=centered * centered, minlength=groups)
+    means = sums / counts
+    ss_between = float((sums * means).sum())
+    ss_total = float(sumsq.sum())
+    ss_within = ss_total - ss_between
+    result = {
+        "groups": pd.DataFrame({
+            "n": counts,
+            "mean": means + (values.mean() if n else 0.0),
+            "std": np.sqrt(np.divide(sumsq - sums * means, counts - 1,
+                                     out=np.full(groups, np.nan), where=counts > 1)),
+        }, index=pd.Index(labels, name=cat_col)),
+        "n": int(n),
+        "k": groups,
+        "f": np.nan, "f_p": np.nan, "h": np.nan, "h_p": np.nan,
+        "eta_sq": np.nan, "point_biserial": np.nan, "point_biserial_p": np.nan,
+    }
+    if groups < 2 or n <= groups:
+        return result
+    df_between, df_within = groups - 1, n - groups
+    if ss_within <= 1e-12 * ss_total:
+        # Nilai konstan di setiap grup: F tak hingga bila rata-rata grup berbeda, NaN bila semua konstan
+        f = np.inf if ss_between > 0 else np.nan
+    else:
+        f = (ss_between / df_between) / (ss_within / df_within)
+    result["f"] = float(f)
+    result["f_p"] = float(stats.f.sf(f, df_between, df_within))
+    result["eta_sq"] = ss_between / ss_total if ss_total > 0 else np.nan
+
+    ranks = stats.rankdata(values)
+    rank_sums = np.bincount(codes, weights=ranks, minlength=groups)
+    h = 12.0 / (n * (n + 1)) * (rank_sums ** 2 / counts).sum() - 3.0 * (n + 1)
+    _, ties = np.unique(values, return_counts=True)
+    tie_correction = 1.0 - (ties ** 3 - ties).sum() / (n ** 3 - n)
+    if tie_correction > 0:
+        h /= tie_correction
+        result["h"] = float(h)
+        result["h_p"] = float(stats.chi2.sf(h, df_between))
+
+    if groups == 2 and ss_total > 0:
+        # Korelasi antara nilai dan indikator grup kedua
+        r = np.sqrt(result["eta_sq"]) * np.sign(means[1] - means[0])
+        result["point_biserial"] = float(r)
+        with np.errstate(divide="ignore"):
+            t = r * np.sqrt((n - 2) / (1.0 - r * r)) if abs(r) < 1 else np.inf
+        result["point_biserial_p"] = float(2.0 * stats.t.sf(abs(t), n - 2))
+    return result
+
+
+def matrix_pairs(matrices, stat_key, effect_key):
+    """Ubah hasil matriks menjadi tabel panjang: satu baris per pasangan (i < j)."""
+    stat = matrices[stat_key]
+    columns = list(stat.columns)
+    i, j = np.triu_indices(len(columns), k=1)
+    table = pd.DataFrame({
+        "var1": np.asarray(columns, dtype=object)[i],
+        "var2": np.asarray(columns, dtype=object)[j],
+        stat_key: stat.to_numpy()[i, j],
+    })
+    if effect_key != stat_key:
+        table[effect_key] = matrices[effect_key].to_numpy()[i, j]
+    table["p"] = matrices["p"].to_numpy()[i, j]
+    table["n"] = matrices["n"].to_numpy()[i, j].astype(np.int64)
+    return table
+
+
+# --- Mesin dengan cache hasil ---
+class AnalysisEngine:
+    """Akses analisis untuk satu dataset, dengan cache hasil bersama."""
+
+    def __init__(self, df, fingerprint=None, cache=None):
+        self.df = df
+        self.fingerprint = fingerprint or dataset_fingerprint(df)
+        self.cache = cache if cache is not None else LRUCache(max_entries=RESULT_CACHE_MAX_ENTRIES)
+
+    def _memo(self, name, args, compute):
+        return self.cache.get_or_compute((self.fingerprint, name) + tuple(args), compute)
+
+    def profiles(self):
+        """Indeks profil kolom, dibangun sekali per dataset."""
+        return self._memo("profiles", (), lambda: build_profiles(self.df))
+
+    def kind(self, column):
+        return self.profiles()[column].kind
+
+    def columns_of_kind(self, kind):
+        return [name for name, profile in self.profiles().items() if profile.kind == kind]
+
+    def describe(self, columns):
+        columns = tuple(columns)
+        return self._memo("describe", columns, lambda: describe_columns(self.df, columns))
+
+    def crosstab_chi2(self, x1, x2, n_permutations=PERMUTATIONS, seed=None):
+        return self._memo("crosstab_chi2", (x1, x2, n_permutations, seed),
+                          lambda: crosstab_chi2(self.df, x1, x2, self.profiles(), n_permutations, seed))
+
+    def correlation(self, x1, x2, method=METHOD_PEARSON):
+        return self._memo("correlation", (x1, x2, method), lambda: correlation(self.df, x1, x2, method))
+
+    def correlation_resampling(self, x1, x2, method=METHOD_PEARSON, n_resamples=10_000, seed=None, workers=None):
+        """Bootstrap CI dan p-value permutasi untuk korelasi dua kolom."""
+        # Impor lokal: modul resampling sendiri mengimpor konstanta dari modul ini
+        from resampling import bootstrap_correlation, permutation_correlation
+
+        def compute():
+            a, b = paired_values(self.df, x1, x2)
+            result = bootstrap_correlation(a, b, method, n_resamples, seed=seed, workers=workers)
+            result.update(permutation_correlation(a, b, method, n_resamples, seed=seed, workers=workers))
+            return result
+
+        return self._memo("correlation_resampling", (x1, x2, method, n_resamples, seed), compute)
+
+    def design(self, weight_column=None, strata_column=None):
+        """Bobot dan stratum survei (lihat ``weighting.survey_design``)."""
+        # Impor lokal: modul weighting sendiri mengimpor dari modul ini
+        from weighting import survey_design
+
+        return self._memo("design", (weight_column, strata_column),
+                          lambda: survey_design(self.df, weight_column, strata_column, self.profiles()))
+
+    def describe_weighted(self, columns, weight_column, strata_column=None):
+        from weighting import weighted_describe
+
+        columns = tuple(columns)
+        design = self.design(weight_column, strata_column)
+        return self._memo("describe_weighted", (columns, weight_column, strata_column),
+                          lambda: weighted_describe(self.df, columns, design))
+
+    def crosstab_weighted(self, x1, x2, weight_column, strata_column=None):
+        from weighting import weighted_crosstab_chi2
+
+        design = self.design(weight_column, strata_column)
+        return self._memo("crosstab_weighted", (x1, x2, weight_column, strata_column),
+                          lambda: weighted_crosstab_chi2(self.df, x1, x2, design, self.profiles()))
+
+    def correlation_weighted(self, x1, x2, method, weight_column, strata_column=None):
+        from weighting import weighted_correlation
+
+        design = self.design(weight_column, strata_column)
+        return self._memo("correlation_weighted", (x1, x2, method, weight_column, strata_column),
+                          lambda: weighted_correlation(self.df, x1, x2, design, method))
+
+    def group_comparison(self, num_col, cat_col):
+        return self._memo("group_comparison", (num_col, cat_col),
+                          lambda: group_comparison(self.df, num_col, cat_col, self.profiles()))
+
+    def correlation_matrix(self, columns, method=METHOD_PEARSON):
+        columns = tuple(columns)
+        return self._memo("correlation_matrix", (columns, method),
+                          lambda: correlation_matrix(self.df, columns, method))
+
+    def chi_square_matrix(self, columns):
+        columns = tuple(columns)
+        return self._memo("chi_square_matrix", columns,
+                          lambda: chi_square_matrix(self.df, columns, self.profiles()))
@@ -0,0 +1,235 @@
+"""Jalankan analisis survei tanpa UI untuk banyak file sekaligus.
+
+Contoh::
+
+    python batch.py "data/wilayah_*.xlsx" --spec spec.json --out hasil/ --workers 8
+
+``spec.json`` berisi analisis yang dijalankan untuk setiap file::
+
+    {
+        "sheet": 0,
+        "weight": "bobot", "strata": "wilayah",    (opsional: desain survei)
+        "describe": ["usia", "skor_stres"],       (atau "numeric" untuk semua kolom numerik)
+        "pairs": [
+            {"x1": "gender", "x2": "platform"},
+            {"x1": "usia", "x2": "skor_stres", "method": "spearman"}
+        ]
+    }
+
+Jenis uji setiap pasangan dipilih otomatis seperti di aplikasi (Chi-Square,
+korelasi, atau ANOVA/Kruskal-Wallis). Bila ``weight``/``strata`` diisi,
+deskriptif, Chi-Square (Rao-Scott) dan korelasi memakai estimator berbobot;
+uji perbandingan grup tetap tanpa bobot. Parsing dan analisis setiap file
+berjalan di process pool; hasil ditulis sebagai JSON (per file, dengan jalur
+relatif terhadap folder induk bersama semua input, jadi ``r1/survey.xlsx`` dan
+``r2/survey.xlsx`` tidak bertabrakan) atau Parquet (satu tabel gabungan),
+bersama ringkasan waktu per tahap per file. File output yang sudah ada tidak
+pernah ditimpa.
+"""
+import argparse
+import glob
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+
+from analysis import METHOD_PEARSON, AnalysisEngine
+from ingest import KIND_NUMERIC, file_fingerprint, file_format, read_survey
+
+SURVEY_EXTENSIONS = (".xlsx", ".csv")
+
+
+def find_inputs(pattern):
+    """Daftar file dari direktori (semua .xlsx/.csv di dalamnya) atau pola glob."""
+    if os.path.isdir(pattern):
+        paths = [os.path.join(pattern, name) for name in os.listdir(pattern)]
+    else:
+        paths = glob.glob(pattern, recursive=True)
+    return sorted(p for p in paths if p.lower().endswith(SURVEY_EXTENSIONS) and os.path.isfile(p))
+
+
+def _clean(value):
+    # Nilai NumPy/NaN menjadi tipe JSON biasa
+    if isinstance(value, dict):
+        return {str(k): _clean(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_clean(v) for v in value]
+    if isinstance(value, pd.DataFrame):
+        return _clean(value.to_dict(orient="index"))
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def analyze_pair(engine, x1, x2, method=METHOD_PEARSON, weight=None, strata=None):
+    """Uji hubungan dua variabel dengan jenis uji yang dipilih otomatis."""
+    num1 = engine.kind(x1) == KIND_NUMERIC
+    num2 = engine.kind(x2) == KIND_NUMERIC
+    weighted = weight is not None or strata is not None
+    if num1 and num2:
+        if weighted:
+            result = dict(engine.correlation_weighted(x1, x2, method, weight, strata), test=method)
+        else:
+            result = dict(engine.correlation(x1, x2, method), test=method)
+    elif not num1 and not num2:
+        if weighted:
+            result = dict(engine.crosstab_weighted(x1, x2, weight, strata))
+        else:
+            result = dict(engine.crosstab_chi2(x1, x2, seed=0), test="chi2")
+        result.pop("expected")
+    else:
+        num_col, cat_col = (x1, x2) if num1 else (x2, x1)
+        result = dict(engine.group_comparison(num_col, cat_col), test="group_comparison")
+    return dict(result, x1=x1, x2=x2)
+
+
+def analyze_file(path, spec):
+    """Jalankan ``spec`` pada satu file; kembalikan hasil dan waktu per tahap (detik)."""
+    timings = {}
+    start = time.perf_counter()
+    with open(path, "rb") as f:
+        data = f.read()
+    # Parse langsung tanpa ParseCache: batch sekali jalan tidak boleh mengisi (dan memangkas)
+    # direktori snapshot bersama yang dipakai sesi aplikasi
+    dataset_id = file_fingerprint(data)
+    df = read_survey(data, spec.get("sheet", 0), file_format(path))
+    timings["read"] = time.perf_counter() - start
+
+    mark = time.perf_counter()
+    engine = AnalysisEngine(df, dataset_id)
+    engine.profiles()
+    timings["profile"] = time.perf_counter() - mark
+
+    results = {}
+    weight, strata = spec.get("weight"), spec.get("strata")
+    describe = spec.get("describe")
+    if describe:
+        mark = time.perf_counter()
+        columns = engine.columns_of_kind(KIND_NUMERIC) if describe == "numeric" else describe
+        if weight is not None or strata is not None:
+            results["describe"] = engine.describe_weighted(columns, weight, strata)
+        else:
+            results["describe"] = engine.describe(columns)
+        timings["describe"] = time.perf_counter() - mark
+
+    if spec.get("pairs"):
+        mark = time.perf_counter()
+        results["pairs"] = [
+            analyze_pair(engine, pair["x1"], pair["x2"], pair.get("method", METHOD_PEARSON), weight, strata)
+            for pair in spec["pairs"]
+        ]
+        timings["pairs"] = time.perf_counter() - mark
+
+    timings["total"] = time.perf_counter() - start
+    return {"file": path, "rows": len(df), "timings": timings, "results": _clean(results)}
+
+
+def _flat_tables(outputs):
+    describe_rows, pair_rows = [], []
+    for out in outputs:
+        for variable, stats in out["results"].get("describe", {}).items():
+            describe_rows.append(dict(stats, file=out["file"], variable=variable))
+        for pair in out["results"].get("pairs", []):
+            row = {k: v for k, v in pair.items() if not isinstance(v, (dict, list))}
+            pair_rows.append(dict(row, file=out["file"]))
+    return pd.DataFrame(describe_rows), pd.DataFrame(pair_rows)
+
+
+def input_root(paths):
+    """Folder induk bersama semua input; nama output relatif terhadap folder ini."""
+    return os.path.commonpath([os.path.dirname(os.path.abspath(p)) for p in paths])
+
+
+def output_files(paths, out_dir, fmt, root=None):
+    """Jalur file yang akan ditulis ``write_outputs`` untuk ``paths``."""
+    if fmt == "parquet":
+        names = ["describe.parquet", "pairs.parquet"]
+    else:
+        root = root or input_root(paths)
+        names = [os.path.relpath(os.path.abspath(p), root) + ".json" for p in paths]
+    return [os.path.join(out_dir, name) for name in names + ["timings.json"]]
+
+
+def _dump_json(data, path):
+    # Mode "x": gagal bila file sudah ada, bukan menimpa hasil lain
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "x", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def write_outputs(outputs, out_dir, fmt, root=None):
+    os.makedirs(out_dir, exist_ok=True)
+    files = output_files([out["file"] for out in outputs], out_dir, fmt, root)
+    existing = [path for path in files if os.path.exists(path)]
+    if existing:
+        raise FileExistsError(f"file output sudah ada, tidak ditimpa: {', '.join(existing)}")
+    if fmt == "parquet":
+        describe, pairs = _flat_tables(outputs)
+        describe.to_parquet(files[0], index=False)
+        pairs.to_parquet(files[1], index=False)
+    else:
+        for out, path in zip(outputs, files):
+            _dump_json(out, path)
+    summary = [{"file": out["file"], "rows": out["rows"], **out["timings"]} for out in outputs]
+    _dump_json(summary, files[-1])
+
+
+def run(paths, spec, workers=None, progress=sys.stderr):
+    """Analisis semua ``paths`` paralel; hasil diurutkan sesuai urutan input."""
+    outputs, failures = {}, {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(analyze_file, path, spec): path for path in paths}
+        for done, future in enumerate(as_completed(futures), start=1):
+            path = futures[future]
+            try:
+                outputs[path] = future.result()
+                status = f"{outputs[path]['timings']['total']:.2f}s"
+            except Exception as exc:  # satu file rusak tidak menghentikan yang lain
+                failures[path] = f"{type(exc).__name__}: {exc}"
+                status = f"GAGAL ({failures[path]})"
+            print(f"[{done}/{len(paths)}] {path} {status}", file=progress, flush=True)
+    return [outputs[p] for p in paths if p in outputs], failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Analisis batch file survei (.xlsx/.csv).")
+    parser.add_argument("inputs", help="Direktori atau pola glob file survei")
+    parser.add_argument("--spec", required=True, help="File JSON berisi analisis yang dijalankan")
+    parser.add_argument("--out", required=True, help="Direktori output")
+    parser.add_argument("--format", choices=("json", "parquet"), default="json")
+    parser.add_argument("--workers", type=int, default=None, help="Jumlah proses (default: semua core)")
+    args = parser.parse_args(argv)
+
+    with open(args.spec, encoding="utf-8") as f:
+        spec = json.load(f)
+    paths = find_inputs(args.inputs)
+    if not paths:
+        parser.error(f"tidak ada file .xlsx/.csv yang cocok dengan {args.inputs!r}")
+    if args.format == "parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            parser.error("format parquet membutuhkan paket pyarrow")
+
+    root = input_root(paths)
+    existing = [path for path in output_files(paths, args.out, args.format, root) if os.path.exists(path)]
+    if existing:
+        parser.error(f"file output sudah ada, tidak ditimpa: {', '.join(existing)}")
+
+    start = time.perf_counter()
+    outputs, failures = run(paths, spec, args.workers)
+    write_outputs(outputs, args.out, args.format, root)
+    print(f"Selesai: {len(outputs)} file berhasil, {len(failures)} gagal, "
+          f"{time.perf_counter() - start:.1f}s", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,285 @@
+"""Benchmark tahap-tahap analisis pada data survei sintetis yang bisa direproduksi.
+
+Contoh::
+
+    python benchmark.py --scale small medium --format csv --repeat 3
+    python benchmark.py --rows 1000 100000 --cols 10 100 --baseline bench/baseline.json --save-baseline
+    python benchmark.py --scale medium --baseline bench/baseline.json    (exit 1 bila ada regresi)
+
+Data dibuat dari seed tetap (kolom numerik, item Likert 1-5 dan kategori
+dengan beberapa kardinalitas, ~2% nilai kosong) lalu ditulis sebagai .xlsx
+atau .csv ke ``--data-dir``; file yang sudah ada dipakai ulang. Setiap tahap
+yang dijalankan aplikasi diukur terpisah: ingest, penentuan jenis kolom,
+describe/skew/kurtosis, render histogram/boxplot, crosstab + Chi-Square dan
+korelasi Pearson/Spearman. Waktu minimum dari ``--repeat`` putaran
+dibandingkan dengan baseline JSON yang tersimpan.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from analysis import METHOD_PEARSON, METHOD_SPEARMAN, correlation, crosstab_chi2, describe_columns
+from cache import LRUCache
+from charts import ChartRenderer
+from column_profile import build_profiles
+from ingest import KIND_CATEGORICAL, read_survey
+
+# Skala bawaan: (baris, kolom)
+SCALES = {
+    "small": (1_000, 10),
+    "medium": (100_000, 100),
+    "wide": (10_000, 1_000),
+    "large": (1_000_000, 100),
+    "huge": (10_000_000, 1_000),
+}
+STAGES = ("ingest", "column_typing", "describe", "charts", "crosstab_chi2", "pearson", "spearman")
+
+NUMERIC_SHARE = 0.4
+LIKERT_SHARE = 0.3
+LIKERT_LEVELS = 5
+CATEGORY_LEVELS = (2, 4, 8, 30)
+MISSING_RATE = 0.02
+# Ukuran potongan saat membuat data; tetap agar data sama berapa pun ukuran totalnya
+GENERATOR_CHUNK_ROWS = 100_000
+XLSX_MAX_ROWS = 1_048_575
+
+DATA_DIR = os.path.join(tempfile.gettempdir(), "survey_benchmark_data")
+DEFAULT_TOLERANCE = 0.2
+# Selisih di bawah ini dianggap derau pengukuran, bukan regresi
+MIN_REGRESSION_SECONDS = 0.005
+
+
+# --- Generator data sintetis ---
+def column_plan(n_cols):
+    """Nama dan jenis kolom: numerik, Likert, lalu kategori."""
+    n_numeric = max(1, round(n_cols * NUMERIC_SHARE))
+    n_likert = round(n_cols * LIKERT_SHARE)
+    n_categorical = max(0, n_cols - n_numeric - n_likert)
+    plan = [(f"num_{i:04d}", "numeric", None) for i in range(n_numeric)]
+    plan += [(f"likert_{i:04d}", "likert", LIKERT_LEVELS) for i in range(n_likert)]
+    plan += [(f"cat_{i:04d}", "categorical", CATEGORY_LEVELS[i % len(CATEGORY_LEVELS)])
+             for i in range(n_categorical)]
+    return plan
+
+
+def _synthetic_chunk(plan, rows, rng, column_params):
+    # Satu faktor laten per baris supaya kolom saling berkorelasi lemah
+    latent = rng.standard_normal(rows)
+    data = {}
+    for (name, kind, levels), (loading, shift, probs) in zip(plan, column_params):
+        noise = rng.standard_normal(rows)
+        if kind == "numeric":
+            values = 10.0 * (loading * latent + noise) + shift
+            values = np.round(np.where(shift > 50, np.exp(values / 40.0), values), 3)
+        elif kind == "likert":
+            values = np.clip(np.round(3 + loading * latent + noise), 1, levels)
+        else:
+            codes = rng.choice(levels, size=rows, p=probs)
+            values = np.array([f"{name}_{k}" for k in range(levels)], dtype=object)[codes]
+        missing = rng.random(rows) < MISSING_RATE
+        if kind == "categorical":
+            values[missing] = None
+        else:
+            values = np.where(missing, np.nan, values)
+        data[name] = values
+    return pd.DataFrame(data)
+
+
+def iter_synthetic_survey(n_rows, n_cols, seed=0):
+    """Hasilkan data survei sintetis per potongan ``GENERATOR_CHUNK_ROWS`` baris."""
+    plan = column_plan(n_cols)
+    param_rng = np.random.default_rng([seed, n_cols])
+    column_params = []
+    for _, kind, levels in plan:
+        probs = param_rng.dirichlet(np.ones(levels)) if kind == "categorical" else None
+        column_params.append((param_rng.uniform(0.0, 0.8), param_rng.uniform(0.0, 100.0), probs))
+    chunks = range(0, n_rows, GENERATOR_CHUNK_ROWS)
+    seeds = np.random.SeedSequence([seed, n_cols]).spawn(len(chunks))
+    for start, chunk_seed in zip(chunks, seeds):
+        rows = min(GENERATOR_CHUNK_ROWS, n_rows - start)
+        yield _synthetic_chunk(plan, rows, np.random.default_rng(chunk_seed), column_params)
+
+
+def synthetic_survey(n_rows, n_cols, seed=0):
+    """Seluruh data sintetis sebagai satu DataFrame."""
+    return pd.concat(list(iter_synthetic_survey(n_rows, n_cols, seed)), ignore_index=True)
+
+
+def dataset_key(n_rows, n_cols, fmt, seed):
+    return f"rows={n_rows},cols={n_cols},fmt={fmt},seed={seed}"
+
+
+def write_dataset(n_rows, n_cols, fmt="csv", seed=0, data_dir=DATA_DIR):
+    """Tulis data sintetis ke ``data_dir`` (dipakai ulang bila sudah ada); kembalikan path-nya."""
+    if fmt == "xlsx" and n_rows > XLSX_MAX_ROWS:
+        raise ValueError(f"Excel dibatasi {XLSX_MAX_ROWS} baris data; pakai --format csv untuk {n_rows} baris")
+    os.makedirs(data_dir, exist_ok=True)
+    path = os.path.join(data_dir, f"survey_{n_rows}x{n_cols}_seed{seed}.{fmt}")
+    if os.path.exists(path):
+        return path
+    tmp = os.path.join(data_dir, f"tmp_{os.getpid()}_{os.path.basename(path)}")
+    if fmt == "csv":
+        for i, chunk in enumerate(iter_synthetic_survey(n_rows, n_cols, seed)):
+            chunk.to_csv(tmp, mode="w" if i == 0 else "a", header=i == 0, index=False)
+    else:
+        with pd.ExcelWriter(tmp, engine="openpyxl") as writer:
+            synthetic_survey(n_rows, n_cols, seed).to_excel(writer, index=False)
+    os.replace(tmp, path)
+    return path
+
+
+# --- Pengukuran tahap ---
+def _pairs(columns, limit):
+    return [(columns[i], columns[i + 1]) for i in range(min(limit, len(columns) - 1))]
+
+
+def run_stages(path, fmt, max_pairs=10, max_charts=10):
+    """Jalankan semua tahap sekali pada ``path``; kembalikan waktu per tahap (detik)."""
+    timings = {}
+
+    def timed(stage, compute):
+        start = time.perf_counter()
+        result = compute()
+        timings[stage] = time.perf_counter() - start
+        return result
+
+    def ingest():
+        with open(path, "rb") as f:
+            return read_survey(f.read(), fmt=fmt)
+
+    df = timed("ingest", ingest)
+    profiles = timed("column_typing", lambda: build_profiles(df))
+    numeric = [name for name, profile in profiles.items() if profile.is_numeric]
+    continuous = [name for name in numeric if not profiles[name].likert]
+    categorical = [name for name, profile in profiles.items() if profile.kind == KIND_CATEGORICAL]
+
+    timed("describe", lambda: describe_columns(df, numeric))
+    # Renderer baru setiap putaran: yang diukur render-nya, bukan cache
+    renderer = ChartRenderer(LRUCache())
+    timed("charts", lambda: [(renderer.histogram("bench", df, c, c), renderer.boxplot("bench", df, c, c))
+                             for c in continuous[:max_charts]])
+    timed("crosstab_chi2", lambda: [crosstab_chi2(df, a, b, profiles, seed=0)
+                                    for a, b in _pairs(categorical, max_pairs)])
+    timed("pearson", lambda: [correlation(df, a, b, METHOD_PEARSON) for a, b in _pairs(continuous, max_pairs)])
+    timed("spearman", lambda: [correlation(df, a, b, METHOD_SPEARMAN) for a, b in _pairs(continuous, max_pairs)])
+    return timings
+
+
+def benchmark_dataset(path, fmt, repeat=3, max_pairs=10, max_charts=10):
+    """Ulangi ``run_stages``; ringkas jadi waktu minimum dan median per tahap."""
+    runs = [run_stages(path, fmt, max_pairs, max_charts) for _ in range(repeat)]
+    return {
+        stage: {"min": float(np.min(values)), "median": float(np.median(values))}
+        for stage in STAGES
+        for values in [[run[stage] for run in runs]]
+    }
+
+
+def environment():
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+    }
+
+
+# --- Baseline ---
+def load_baseline(path):
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f).get("results", {})
+
+
+def save_baseline(path, results):
+    """Gabungkan ``results`` ke file baseline (dataset lain yang sudah ada tetap disimpan)."""
+    merged = dict(load_baseline(path), **results)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"environment": environment(), "results": merged}, f, indent=2)
+
+
+def compare(results, baseline, tolerance=DEFAULT_TOLERANCE, min_seconds=MIN_REGRESSION_SECONDS):
+    """Tabel perbandingan waktu minimum terhadap baseline, satu baris per (dataset, tahap)."""
+    rows = []
+    for key, stages in results.items():
+        for stage, now in stages.items():
+            before = baseline.get(key, {}).get(stage)
+            if before is None:
+                status, ratio = "new", np.nan
+            else:
+                ratio = now["min"] / before["min"] if before["min"] > 0 else np.nan
+                slower = now["min"] - before["min"]
+                if now["min"] > before["min"] * (1 + tolerance) and slower > min_seconds:
+                    status = "REGRESSION"
+                elif before["min"] > now["min"] * (1 + tolerance) and -slower > min_seconds:
+                    status = "faster"
+                else:
+                    status = "ok"
+            rows.append({
+                "dataset": key, "stage": stage, "seconds": now["min"],
+                "baseline": before["min"] if before else np.nan, "ratio": ratio, "status": status,
+            })
+    return pd.DataFrame(rows, columns=["dataset", "stage", "seconds", "baseline", "ratio", "status"])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark tahap analisis pada data survei sintetis.")
+    parser.add_argument("--scale", nargs="*", choices=sorted(SCALES), default=None,
+                        help="Skala bawaan (baris x kolom): " + ", ".join(f"{k}={r}x{c}" for k, (r, c) in SCALES.items()))
+    parser.add_argument("--rows", nargs="*", type=int, default=[], help="Jumlah baris (dikombinasikan dengan --cols)")
+    parser.add_argument("--cols", nargs="*", type=int, default=[], help="Jumlah kolom (dikombinasikan dengan --rows)")
+    parser.add_argument("--format", choices=("csv", "xlsx"), default="csv")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-pairs", type=int, default=10, help="Pasangan per uji hubungan")
+    parser.add_argument("--max-charts", type=int, default=10, help="Kolom yang dirender grafiknya")
+    parser.add_argument("--data-dir", default=DATA_DIR)
+    parser.add_argument("--baseline", default=None, help="File JSON baseline untuk perbandingan")
+    parser.add_argument("--save-baseline", action="store_true", help="Simpan hasil sebagai baseline baru")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Perlambatan relatif yang masih diterima (default 0.2 = 20%%)")
+    parser.add_argument("--out", default=None, help="Tulis hasil lengkap ke file JSON ini")
+    args = parser.parse_args(argv)
+
+    if bool(args.rows) != bool(args.cols):
+        parser.error("--rows dan --cols harus diisi bersama")
+    sizes = [(r, c) for r in args.rows for c in args.cols]
+    sizes += [SCALES[name] for name in (args.scale or ([] if sizes else ["small"]))]
+    if args.save_baseline and not args.baseline:
+        parser.error("--save-baseline membutuhkan --baseline")
+
+    results = {}
+    for n_rows, n_cols in sizes:
+        key = dataset_key(n_rows, n_cols, args.format, args.seed)
+        try:
+            path = write_dataset(n_rows, n_cols, args.format, args.seed, args.data_dir)
+        except ValueError as exc:
+            print(f"{key}: dilewati ({exc})", file=sys.stderr)
+            continue
+        start = time.perf_counter()
+        results[key] = benchmark_dataset(path, args.format, args.repeat, args.max_pairs, args.max_charts)
+        print(f"{key}: selesai {time.perf_counter() - start:.1f}s", file=sys.stderr, flush=True)
+
+    report = compare(results, load_baseline(args.baseline), args.tolerance)
+    print(report.to_string(index=False, float_format=lambda v: f"{v:.4f}"))
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump({"environment": environment(), "results": results}, f, indent=2)
+    if args.save_baseline:
+        save_baseline(args.baseline, results)
+        return 0
+    return 1 if (report["status"] == "REGRESSION").any() else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
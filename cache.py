@@ -0,0 +1,105 @@
+"""Cache LRU sederhana dengan batas ukuran dan penghitung hit/miss.
+
+Dipakai bersama oleh proses ingest (hasil parse workbook) dan mesin analisis,
+tanpa bergantung pada Streamlit.
+"""
+import sys
+import threading
+from collections import OrderedDict
+
+
+def estimate_size(value):
+    """Perkiraan ukuran objek dalam byte (DataFrame/array/bytes, lainnya kasar)."""
+    memory_usage = getattr(value, "memory_usage", None)
+    if callable(memory_usage):
+        try:
+            usage = memory_usage(deep=True)
+            return int(usage.sum() if hasattr(usage, "sum") else usage)
+        except TypeError:
+            pass
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    if isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value.values())
+    return sys.getsizeof(value)
+
+
+class LRUCache:
+    """Cache LRU yang dibatasi jumlah entri dan/atau total byte.
+
+    Entri yang lebih besar dari ``max_bytes`` tidak disimpan sama sekali.
+    """
+
+    def __init__(self, max_entries=None, max_bytes=None, sizeof=estimate_size):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.current_bytes = 0
+        self._data = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key][0]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        size = self.sizeof(value)
+        with self._lock:
+            if key in self._data:
+                self.current_bytes -= self._data.pop(key)[1]
+            if self.max_bytes is not None and size > self.max_bytes:
+                return value
+            self._data[key] = (value, size)
+            self.current_bytes += size
+            self._evict()
+        return value
+
+    def get_or_compute(self, key, compute):
+        """Ambil dari cache, atau hitung dengan ``compute()`` lalu simpan."""
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            value = self.put(key, compute())
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.current_bytes = 0
+
+    def stats(self):
+        return {
+            "entries": len(self._data),
+            "bytes": self.current_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _evict(self):
+        while self._data and (
+            (self.max_entries is not None and len(self._data) > self.max_entries)
+            or (self.max_bytes is not None and self.current_bytes > self.max_bytes)
+        ):
+            _, (_, size) = self._data.popitem(last=False)
+            self.current_bytes -= size
+            self.evictions += 1
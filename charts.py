@@ -0,0 +1,142 @@
+"""Grafik distribusi dari ringkasan yang sudah dihitung (bin histogram, 5 angka boxplot).
+
+Data mentah hanya dilewati sekali dengan NumPy; matplotlib cukup menggambar
+beberapa puluh angka. Gambar PNG disimpan di cache per
+``(dataset, kolom, tema, judul)`` dan figure selalu dilepas setelah dirender.
+"""
+import io
+
+import numpy as np
+
+from cache import LRUCache
+
+HIST_BINS = 20
+MAX_FLIERS = 200
+CHART_CACHE_MAX_BYTES = 128 * 1024 * 1024
+
+# Tema Teknik/Engineering Blue/Yellow yang sama dengan CSS aplikasi
+THEME_ENGINEERING = (
+    ("bar", "#1976d2"),
+    ("face", "#223a5e"),
+    ("box_face", "#f7c325"),
+    ("box_edge", "#1976d2"),
+)
+
+
+def histogram_bins(values, bins=HIST_BINS):
+    """Hitungan dan tepi bin histogram (sama dengan ``ax.hist(values, bins)``)."""
+    return np.histogram(values, bins=bins)
+
+
+def box_stats(values, max_fliers=MAX_FLIERS):
+    """Ringkasan boxplot (kuartil, whisker 1.5 IQR, pencilan) untuk ``ax.bxp``.
+
+    Jumlah pencilan yang digambar dibatasi ``max_fliers`` (diambil merata dari
+    pencilan terurut, nilai paling ekstrem selalu ikut).
+    """
+    q1, med, q3 = np.percentile(values, [25, 50, 75])
+    iqr = q3 - q1
+    low_limit, high_limit = q1 - 1.5 * iqr, q3 + 1.5 * iqr
+    inside = values[(values >= low_limit) & (values <= high_limit)]
+    fliers = np.sort(values[(values < low_limit) | (values > high_limit)])
+    if len(fliers) > max_fliers:
+        fliers = fliers[np.linspace(0, len(fliers) - 1, max_fliers).round().astype(np.int64)]
+    return {
+        "med": med, "q1": q1, "q3": q3,
+        "whislo": inside.min() if len(inside) else q1,
+        "whishi": inside.max() if len(inside) else q3,
+        "fliers": fliers,
+    }
+
+
+def column_chart_stats(series, bins=HIST_BINS):
+    """Bin histogram dan ringkasan boxplot untuk satu kolom numerik."""
+    values = series.to_numpy(dtype=float, na_value=np.nan)
+    values = values[np.isfinite(values)]
+    if len(values) == 0:
+        return None
+    counts, edges = histogram_bins(values, bins)
+    return {"counts": counts, "edges": edges, "box": box_stats(values)}
+
+
+def _new_figure(nrows=1, ncols=1, figsize=(7, 3)):
+    # Figure tanpa pyplot: tidak terdaftar di state global, jadi tidak menumpuk
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize)
+    return fig, fig.subplots(nrows, ncols, squeeze=False)
+
+
+def _to_png(fig):
+    buffer = io.BytesIO()
+    try:
+        fig.savefig(buffer, format="png", bbox_inches="tight")
+    finally:
+        fig.clear()
+    return buffer.getvalue()
+
+
+def _draw_histogram(ax, chart, title, theme):
+    ax.stairs(chart["counts"], chart["edges"], fill=True, color=theme["bar"], alpha=0.86)
+    ax.set_facecolor(theme["face"])
+    ax.set_title(title, fontsize=13, fontweight="bold")
+
+
+def _draw_boxplot(ax, chart, title, theme):
+    ax.bxp([chart["box"]], orientation="horizontal", patch_artist=True,
+           boxprops=dict(facecolor=theme["box_face"], color=theme["box_edge"]))
+    ax.set_facecolor(theme["face"])
+    ax.set_title(title, fontsize=13, fontweight="bold")
+
+
+class ChartRenderer:
+    """Render histogram/boxplot menjadi PNG dengan cache bersama."""
+
+    def __init__(self, cache=None, theme=THEME_ENGINEERING, bins=HIST_BINS):
+        self.cache = cache if cache is not None else LRUCache(max_bytes=CHART_CACHE_MAX_BYTES)
+        self.theme = tuple(theme)
+        self.colors = dict(theme)
+        self.bins = bins
+
+    def stats(self, fingerprint, df, column):
+        return self.cache.get_or_compute(
+            (fingerprint, "chart_stats", column, self.bins),
+            lambda: column_chart_stats(df[column], self.bins))
+
+    def histogram(self, fingerprint, df, column, title):
+        chart = self.stats(fingerprint, df, column)
+        if chart is None:
+            return None
+        return self.cache.get_or_compute(
+            (fingerprint, "hist_png", column, self.theme, title),
+            lambda: self._render_single(_draw_histogram, chart, title))
+
+    def boxplot(self, fingerprint, df, column, title):
+        chart = self.stats(fingerprint, df, column)
+        if chart is None:
+            return None
+        return self.cache.get_or_compute(
+            (fingerprint, "box_png", column, self.theme, title),
+            lambda: self._render_single(_draw_boxplot, chart, title))
+
+    def small_multiples(self, fingerprint, df, columns, hist_title, box_title):
+        """Satu figure berisi histogram + boxplot untuk semua kolom (satu baris per kolom)."""
+        charts = [(c, self.stats(fingerprint, df, c)) for c in columns]
+        charts = [(c, chart) for c, chart in charts if chart is not None]
+        if not charts:
+            return None
+        key = (fingerprint, "multiples_png", tuple(c for c, _ in charts), self.theme, hist_title, box_title)
+        return self.cache.get_or_compute(key, lambda: self._render_multiples(charts, hist_title, box_title))
+
+    def _render_single(self, draw, chart, title):
+        fig, axes = _new_figure()
+        draw(axes[0, 0], chart, title, self.colors)
+        return _to_png(fig)
+
+    def _render_multiples(self, charts, hist_title, box_title):
+        fig, axes = _new_figure(len(charts), 2, figsize=(12, 2.6 * len(charts)))
+        for row, (column, chart) in enumerate(charts):
+            _draw_histogram(axes[row, 0], chart, f"{hist_title}: {column}", self.colors)
+            _draw_boxplot(axes[row, 1], chart, f"{box_title}: {column}", self.colors)
+        fig.tight_layout()
+        return _to_png(fig)
@@ -0,0 +1,83 @@
+"""Indeks profil kolom yang dibangun sekali per dataset.
+
+Setiap kolom dicatat jenisnya (numerik, kategori, lainnya; item Likert yang
+dikodekan angka ditandai), jumlah nilai kosong, kardinalitas, dan untuk
+kolom kategori/Likert kode integer ringkas (``-1`` = kosong). Analisis
+berikutnya (crosstab, uji grup, matriks) memakai kode ini langsung.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from ingest import KIND_CATEGORICAL, KIND_NUMERIC, codes_dtype, column_kind
+
+# Item Likert: bilangan bulat dengan sedikit level dalam rentang skala umum
+LIKERT_MAX_LEVELS = 11
+LIKERT_VALUE_RANGE = (0, 10)
+
+
+@dataclass(frozen=True)
+class ColumnProfile:
+    name: object
+    kind: str
+    dtype: str
+    null_count: int
+    cardinality: int
+    likert: bool = False
+    codes: np.ndarray = None
+    categories: np.ndarray = None
+
+    @property
+    def is_numeric(self):
+        return self.kind == KIND_NUMERIC
+
+    @property
+    def has_codes(self):
+        return self.codes is not None
+
+
+def category_codes(series):
+    """Kode integer kategori (-1 untuk kosong) dan label kategorinya.
+
+    Kode memakai dtype ringkas seperti pandas (int8 sampai 126 kategori, dst.).
+    Untuk kolom Categorical, array kodenya dipakai langsung tanpa salinan,
+    termasuk kode mmap dari snapshot. Pemanggil melebarkan ke int64 sendiri
+    bila menyusun kunci gabungan untuk ``bincount``.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # ``series.array.codes`` adalah view; ``series.cat.codes`` membuat Series (salinan) baru
+        return series.array.codes, np.asarray(series.cat.categories, dtype=object)
+    codes, uniques = pd.factorize(series, sort=True)
+    return codes.astype(codes_dtype(len(uniques))), np.asarray(uniques, dtype=object)
+
+
+def _is_likert(values):
+    if len(values) == 0 or len(values) > LIKERT_MAX_LEVELS:
+        return False
+    low, high = LIKERT_VALUE_RANGE
+    return bool(np.all(values == np.round(values)) and values.min() >= low and values.max() <= high)
+
+
+def profile_column(series):
+    kind = column_kind(series)
+    null_count = int(series.isna().sum())
+    if kind == KIND_CATEGORICAL:
+        codes, categories = category_codes(series)
+        return ColumnProfile(series.name, kind, str(series.dtype), null_count, len(categories),
+                             codes=codes, categories=categories)
+    if kind == KIND_NUMERIC:
+        values = series.to_numpy(dtype=float, na_value=np.nan)
+        uniques = pd.unique(values[~np.isnan(values)])
+        if _is_likert(uniques):
+            codes, categories = category_codes(series)
+            return ColumnProfile(series.name, kind, str(series.dtype), null_count, len(uniques),
+                                 likert=True, codes=codes, categories=categories)
+        return ColumnProfile(series.name, kind, str(series.dtype), null_count, len(uniques))
+    return ColumnProfile(series.name, kind, str(series.dtype), null_count, int(series.nunique()))
+
+
+def build_profiles(df):
+    """Profil semua kolom ``df`` (urutan sama dengan kolom)."""
+    return {name: profile_column(df[name]) for name in df.columns}
+
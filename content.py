@@ -0,0 +1,589 @@
+"""Teks antarmuka (empat bahasa) dan data profil pembuat.
+
+Semua konstanta di sini dibangun sekali saat modul pertama kali diimpor dan
+dibekukan (``MappingProxyType`` dan tuple), jadi setiap rerun Streamlit hanya
+membaca struktur yang sama tanpa membangun ulang kamus. ``thumbnail`` membuat
+versi kecil foto profil; pemanggil menyimpannya di cache proses.
+"""
+import io
+from types import MappingProxyType
+
+# Lebar foto di halaman profil; thumbnail dibuat 2x agar tetap tajam di layar HiDPI
+PROFILE_IMAGE_WIDTH = 265
+THUMBNAIL_SCALE = 2
+THUMBNAIL_QUALITY = 85
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def thumbnail(path, width=PROFILE_IMAGE_WIDTH * THUMBNAIL_SCALE, quality=THUMBNAIL_QUALITY):
+    """JPEG ``path`` diperkecil ke lebar ``width`` piksel (tidak pernah diperbesar), sebagai bytes."""
+    from PIL import Image
+
+    with Image.open(path) as image:
+        image = image.convert("RGB")
+        if image.width > width:
+            image = image.resize((width, round(image.height * width / image.width)), Image.LANCZOS)
+        buffer = io.BytesIO()
+        image.save(buffer, format="JPEG", quality=quality, optimize=True)
+    return buffer.getvalue()
+
+
+# --- Bahasa & bendera (sidebar) ---
+LANGUAGES = ("Indonesia", "English", "日本語", "简体中文")
+LANGUAGE_FLAGS = _freeze({
+    "Indonesia": "🇮🇩",
+    "English": "🇬🇧",
+    "日本語": "🇯🇵",
+    "简体中文": "🇨🇳"
+})
+
+SIDEBAR_MENU = _freeze({
+    "Indonesia": ["Profil Pembuat", "Analisis Data", "Tentang Aplikasi"],
+    "English": ["Author Profile", "Data Analysis", "About App"],
+    "日本語": ["著者プロフィール", "データ分析", "アプリについて"],
+    "简体中文": ["作者简介", "数据分析", "关于应用"],
+})
+
+# --- Multilanguage dictionary untuk semua label/instruksi dan output ---
+
+TEXT = _freeze({
+    "Indonesia": {
+        "title": "Aplikasi Analisis Data Survei",
+        "file": "Upload file Excel/CSV data survei",
+        "analysis_title": "Analisis Data",
+        "desc_title": "Distribusi Data",
+        "desc_cols": "Pilih variabel numerik untuk analisis deskriptif (histogram & boxplot)",
+        "hist": "Histogram",
+        "box": "Boxplot",
+        "preview": "Preview Data",
+        "vra_title": "Analisis Hubungan Variabel",
+        "vra_var1": "Pilih Variabel 1",
+        "vra_var2": "Pilih Variabel 2",
+        "type_num": "Numerik", "type_cat": "Kategori",
+        "cat_info": "Variabel kategorik → menggunakan Chi-Square",
+        "num_info": "Variabel numerik → korelasi Pearson/Spearman",
+        "corr_method_label": "Pilih metode korelasi",
+        "pearson": "Pearson",
+        "spearman": "Spearman",
+        "result_cat_cat": "Tabel Kontingensi",
+        "result_num_num": "Korelasi",
+        "chi2": "Chi2 = {:.4f}",
+        "pval": "P-value = {:.4f}",
+        "dof": "Degrees of freedom = {}",
+        "conclusion": "Kesimpulan:",
+        "conclude_sig": "Terdapat hubungan signifikan antara variabel (p < {alpha})",
+        "conclude_nosig": "Tidak terdapat hubungan signifikan antara variabel (p >= {alpha})",
+        "corr_coef": "Koefisien = {:.4f}",
+        "corr_pval": "P-value = {:.4f}",
+        "corr_conclude_sig": "Terdapat hubungan signifikan (p < {alpha})",
+        "corr_conclude_nosig": "Tidak terdapat hubungan signifikan (p >= {alpha})",
+        "mix_info": "Variabel numerik × kategorik → ANOVA / Kruskal-Wallis",
+        "wait_file": "Silakan upload file Excel data survei.",
+        "stream_mode": "Mode streaming (file sangat besar, hanya statistik deskriptif)",
+        "stream_rows": "{:,} baris sudah dibaca",
+        "stream_note": "Mode streaming hanya menampilkan statistik deskriptif. Matikan mode ini untuk grafik dan analisis hubungan variabel.",
+        "matrix_title": "Matriks Asosiasi (Semua Pasangan)",
+        "matrix_enable": "Hitung asosiasi untuk semua pasangan variabel",
+        "matrix_cols": "Pilih variabel (kosongkan = semua)",
+        "matrix_num": "Korelasi antar variabel numerik",
+        "matrix_cat": "Chi-Square antar variabel kategorik (efek: Cramér's V)",
+        "matrix_none": "Butuh minimal dua variabel dengan tipe yang sama.",
+        "alpha_label": "Taraf signifikansi (alpha)",
+        "adj_label": "Koreksi uji berganda",
+        "adj_none": "Tanpa koreksi",
+        "adj_bonferroni": "Bonferroni",
+        "adj_holm": "Holm",
+        "adj_bh": "Benjamini-Hochberg (FDR)",
+        "matrix_sig": "{} dari {} pasangan signifikan setelah koreksi",
+        "mix_method_label": "Pilih uji perbandingan grup",
+        "anova": "ANOVA satu arah",
+        "kruskal": "Kruskal-Wallis",
+        "result_mix": "Perbandingan Grup",
+        "f_stat": "F = {:.4f}",
+        "h_stat": "H = {:.4f}",
+        "eta_sq": "Eta kuadrat = {:.4f}",
+        "pb_corr": "Korelasi point-biserial = {:.4f} (p = {:.4f})",
+        "small_multiples": "Gabungkan semua grafik dalam satu gambar",
+        "page_size": "Baris per halaman",
+        "page": "Halaman",
+        "preview_cols": "Kolom yang ditampilkan (kosongkan = semua)",
+        "sort_by": "Urutkan berdasarkan",
+        "sort_desc": "Urutan menurun",
+        "filter_col": "Filter kolom",
+        "filter_text": "Teks filter",
+        "none_option": "(tidak ada)",
+        "page_info": "Baris {}–{} dari {:,}",
+        "type_likert": "skala Likert",
+        "cramers_v": "Cramér's V = {:.4f}",
+        "expected_title": "Frekuensi harapan",
+        "sparse_fisher": "Banyak sel dengan frekuensi harapan kecil → p-value dari uji eksak Fisher (p asimtotik = {:.4f})",
+        "sparse_perm": "Banyak sel dengan frekuensi harapan kecil → p-value dari uji permutasi Monte-Carlo, {:,} permutasi (p asimtotik = {:.4f})",
+        "resample_label": "Hitung bootstrap CI dan p-value permutasi",
+        "resample_count": "Jumlah resample",
+        "resample_running": "Menghitung resample...",
+        "boot_ci": "Bootstrap CI {:.0%} = [{:.4f}, {:.4f}]",
+        "boot_se": "Standard error bootstrap = {:.4f}",
+        "perm_pval": "P-value permutasi = {:.4f} ({} permutasi)",
+        "design_title": "Desain Survei",
+        "weight_col": "Kolom bobot",
+        "strata_col": "Kolom strata",
+        "weighted_note": "Statistik berbobot; se_mean = standard error rata-rata berbasis desain (linearisasi, per strata).",
+        "unweighted_note": "Bagian ini belum memakai bobot/strata (dihitung tanpa bobot).",
+        "rao_scott": "Uji Rao-Scott untuk data berbobot: Chi-Square dibagi rata-rata design effect = {:.3f}",
+        "design_se": "Standard error (desain) = {:.4f}",
+        "timing_panel": "⏱️ Tampilkan waktu per tahap",
+        "timing_title": "Waktu per tahap (rerun ini)",
+        "timing_total": "Total rerun: {:.3f} detik",
+        "wave_mode": "Mode tambah gelombang (gabungkan gelombang survei baru ke statistik tersimpan)",
+        "wave_title": "Gelombang Survei",
+        "wave_resume": "Lanjutkan dari state gelombang tersimpan (.npz, opsional)",
+        "wave_files": "Unggah file gelombang (.xlsx/.csv, boleh lebih dari satu)",
+        "wave_rows": "Total {} baris dari {} gelombang",
+        "wave_same_var": "Pilih dua variabel yang berbeda.",
+        "wave_mixed": "Mode gelombang menyediakan korelasi Pearson (numerik x numerik) dan Chi-Square (kategori x kategori).",
+        "wave_save": "Unduh state gelombang (.npz)",
+        "wave_note": "Hanya statistik ringkas yang disimpan; setiap gelombang baru hanya memproses barisnya sendiri. Kuartil berupa perkiraan (sketsa kuantil); Spearman dan uji permutasi tidak tersedia di mode ini.",
+        "matrix_excluded": "Kolom non-numerik dengan lebih dari {} kategori tidak ikut secara bawaan (pilih manual bila perlu): {}",
+        "matrix_skipped": "{} pasangan dilewati karena tabel silangnya lebih dari {:,} sel.",
+        "wave_dropped": "Kolom dengan lebih dari {} kategori tidak disimpan untuk tabel silang: {}",
+        "chi2_running": "Menghitung uji Chi-Square...",
+        "sparse_asymptotic": "Banyak sel dengan frekuensi harapan kecil, tetapi data terlalu besar untuk uji permutasi → p-value asimtotik dipakai dan mungkin kurang akurat.",
+        "profile_title": "Profil Pembuat",
+        "about_title": "Tentang Aplikasi",
+        "about_content": "Aplikasi ini dibuat menggunakan Streamlit untuk menganalisis data survei (Excel), analisis deskriptif, dan analisis hubungan variabel otomatis.",
+    },
+    "English": {
+        "title": "Survey Data Analysis App",
+        "file": "Upload your survey Excel/CSV file",
+        "analysis_title": "Data Analysis",
+        "desc_title": "Data Distribution",
+        "desc_cols": "Select numeric variables for descriptive analysis (histogram & boxplot)",
+        "hist": "Histogram",
+        "box": "Boxplot",
+        "preview": "Preview Data",
+        "vra_title": "Variable Relationship Analysis",
+        "vra_var1": "Select Variable 1",
+        "vra_var2": "Select Variable 2",
+        "type_num": "Numeric", "type_cat": "Category",
+        "cat_info": "Categorical variables → Chi-Square test",
+        "num_info": "Numeric variables → Pearson/Spearman correlation",
+        "corr_method_label": "Select correlation method",
+        "pearson": "Pearson",
+        "spearman": "Spearman",
+        "result_cat_cat": "Contingency Table",
+        "result_num_num": "Correlation",
+        "chi2": "Chi2 = {:.4f}",
+        "pval": "P-value = {:.4f}",
+        "dof": "Degrees of freedom = {}",
+        "conclusion": "Conclusion:",
+        "conclude_sig": "Significant relationship between variables (p < {alpha})",
+        "conclude_nosig": "No significant relationship between variables (p >= {alpha})",
+        "corr_coef": "Coefficient = {:.4f}",
+        "corr_pval": "P-value = {:.4f}",
+        "corr_conclude_sig": "Significant relationship (p < {alpha})",
+        "corr_conclude_nosig": "No significant relationship (p >= {alpha})",
+        "mix_info": "Numeric × categorical variables → ANOVA / Kruskal-Wallis",
+        "wait_file": "Please upload your Excel survey file.",
+        "stream_mode": "Streaming mode (very large files, descriptive statistics only)",
+        "stream_rows": "{:,} rows read",
+        "stream_note": "Streaming mode only shows descriptive statistics. Turn it off for charts and variable relationship analysis.",
+        "matrix_title": "Association Matrix (All Pairs)",
+        "matrix_enable": "Compute associations for every pair of variables",
+        "matrix_cols": "Select variables (empty = all)",
+        "matrix_num": "Correlation between numeric variables",
+        "matrix_cat": "Chi-Square between categorical variables (effect: Cramér's V)",
+        "matrix_none": "At least two variables of the same type are needed.",
+        "alpha_label": "Significance level (alpha)",
+        "adj_label": "Multiple-testing correction",
+        "adj_none": "No correction",
+        "adj_bonferroni": "Bonferroni",
+        "adj_holm": "Holm",
+        "adj_bh": "Benjamini-Hochberg (FDR)",
+        "matrix_sig": "{} of {} pairs significant after correction",
+        "mix_method_label": "Select group comparison test",
+        "anova": "One-way ANOVA",
+        "kruskal": "Kruskal-Wallis",
+        "result_mix": "Group Comparison",
+        "f_stat": "F = {:.4f}",
+        "h_stat": "H = {:.4f}",
+        "eta_sq": "Eta squared = {:.4f}",
+        "pb_corr": "Point-biserial correlation = {:.4f} (p = {:.4f})",
+        "small_multiples": "Combine all charts into a single figure",
+        "page_size": "Rows per page",
+        "page": "Page",
+        "preview_cols": "Columns to show (empty = all)",
+        "sort_by": "Sort by",
+        "sort_desc": "Descending",
+        "filter_col": "Filter column",
+        "filter_text": "Filter text",
+        "none_option": "(none)",
+        "page_info": "Rows {}–{} of {:,}",
+        "type_likert": "Likert scale",
+        "cramers_v": "Cramér's V = {:.4f}",
+        "expected_title": "Expected frequencies",
+        "sparse_fisher": "Many cells have small expected counts → p-value from Fisher's exact test (asymptotic p = {:.4f})",
+        "sparse_perm": "Many cells have small expected counts → p-value from a Monte-Carlo permutation test, {:,} permutations (asymptotic p = {:.4f})",
+        "resample_label": "Compute bootstrap CI and permutation p-value",
+        "resample_count": "Number of resamples",
+        "resample_running": "Resampling...",
+        "boot_ci": "Bootstrap {:.0%} CI = [{:.4f}, {:.4f}]",
+        "boot_se": "Bootstrap standard error = {:.4f}",
+        "perm_pval": "Permutation p-value = {:.4f} ({} permutations)",
+        "design_title": "Survey Design",
+        "weight_col": "Weight column",
+        "strata_col": "Strata column",
+        "weighted_note": "Weighted statistics; se_mean = design-based standard error of the mean (linearization, by stratum).",
+        "unweighted_note": "This section does not use weights/strata yet (computed unweighted).",
+        "rao_scott": "Rao-Scott test for weighted data: Chi-Square divided by the mean design effect = {:.3f}",
+        "design_se": "Standard error (design-based) = {:.4f}",
+        "timing_panel": "⏱️ Show per-stage timings",
+        "timing_title": "Per-stage timings (this rerun)",
+        "timing_total": "Rerun total: {:.3f} s",
+        "wave_mode": "Add-wave mode (merge new survey waves into stored statistics)",
+        "wave_title": "Survey Waves",
+        "wave_resume": "Resume from a saved wave state (.npz, optional)",
+        "wave_files": "Upload wave files (.xlsx/.csv, multiple allowed)",
+        "wave_rows": "Total {} rows from {} waves",
+        "wave_same_var": "Select two different variables.",
+        "wave_mixed": "Wave mode provides Pearson correlation (numeric x numeric) and Chi-Square (categorical x categorical).",
+        "wave_save": "Download wave state (.npz)",
+        "wave_note": "Only summary statistics are kept; each new wave processes just its own rows. Quartiles are approximate (quantile sketch); Spearman and permutation tests are not available in this mode.",
+        "matrix_excluded": "Non-numeric columns with more than {} categories are left out by default (select them manually if needed): {}",
+        "matrix_skipped": "{} pairs skipped because their crosstab exceeds {:,} cells.",
+        "wave_dropped": "Columns with more than {} categories are not kept for crosstabs: {}",
+        "chi2_running": "Running the Chi-Square test...",
+        "sparse_asymptotic": "Many cells have small expected counts, but the data is too large for a permutation test → the asymptotic p-value is used and may be less accurate.",
+        "profile_title": "Author Profile",
+        "about_title": "About App",
+        "about_content": "This app is built using Streamlit to analyze survey data, descriptive analysis, and variable relationships automatically.",
+    },
+    "日本語": {
+        "title": "調査データ分析アプリ",
+        "file": "Excel/CSV調査ファイルをアップロード",
+        "analysis_title": "データ分析",
+        "desc_title": "データ分布",
+        "desc_cols": "記述分析用の数値変数を選択（ヒストグラム＆箱ひげ図）",
+        "hist": "ヒストグラム",
+        "box": "箱ひげ図",
+        "preview": "データプレビュー",
+        "vra_title": "変数の関係分析",
+        "vra_var1": "変数1を選択",
+        "vra_var2": "変数2を選択",
+        "type_num": "数値型", "type_cat": "カテゴリ型",
+        "cat_info": "カテゴリ型変数 → カイ二乗検定",
+        "num_info": "数値型変数 → ピアソン/スピアマン相関",
+        "corr_method_label": "相関係数の種類を選ぶ",
+        "pearson": "ピアソン",
+        "spearman": "スピアマン",
+        "result_cat_cat": "クロス集計表",
+        "result_num_num": "相関",
+        "chi2": "カイ二乗 = {:.4f}",
+        "pval": "p値 = {:.4f}",
+        "dof": "自由度 = {}",
+        "conclusion": "結論：",
+        "conclude_sig": "変数間に有意な関係あり (p < {alpha})",
+        "conclude_nosig": "変数間に有意な関係なし (p >= {alpha})",
+        "corr_coef": "相関係数 = {:.4f}",
+        "corr_pval": "p値 = {:.4f}",
+        "corr_conclude_sig": "有意な関係あり (p < {alpha})",
+        "corr_conclude_nosig": "有意な関係なし (p >= {alpha})",
+        "mix_info": "数値型 × カテゴリ型変数 → 分散分析 / クラスカル・ウォリス検定",
+        "wait_file": "調査ファイルをアップロードしてください。",
+        "stream_mode": "ストリーミングモード（大容量ファイル、記述統計のみ）",
+        "stream_rows": "{:,} 行を読み込みました",
+        "stream_note": "ストリーミングモードでは記述統計のみ表示します。グラフや変数の関係分析はモードをオフにしてください。",
+        "matrix_title": "関連行列（全ペア）",
+        "matrix_enable": "全ての変数ペアの関連を計算する",
+        "matrix_cols": "変数を選択（空欄 = 全て）",
+        "matrix_num": "数値型変数間の相関",
+        "matrix_cat": "カテゴリ型変数間のカイ二乗検定（効果量：クラメールのV）",
+        "matrix_none": "同じ型の変数が2つ以上必要です。",
+        "alpha_label": "有意水準（alpha）",
+        "adj_label": "多重比較の補正",
+        "adj_none": "補正なし",
+        "adj_bonferroni": "ボンフェローニ",
+        "adj_holm": "ホルム",
+        "adj_bh": "ベンジャミニ・ホッホベルグ（FDR）",
+        "matrix_sig": "補正後、{1} ペア中 {0} ペアが有意",
+        "mix_method_label": "群間比較の検定を選ぶ",
+        "anova": "一元配置分散分析",
+        "kruskal": "クラスカル・ウォリス検定",
+        "result_mix": "群間比較",
+        "f_stat": "F = {:.4f}",
+        "h_stat": "H = {:.4f}",
+        "eta_sq": "イータ二乗 = {:.4f}",
+        "pb_corr": "点双列相関 = {:.4f} (p = {:.4f})",
+        "small_multiples": "全てのグラフを1枚の図にまとめる",
+        "page_size": "1ページの行数",
+        "page": "ページ",
+        "preview_cols": "表示する列（空欄 = 全て）",
+        "sort_by": "並べ替え",
+        "sort_desc": "降順",
+        "filter_col": "フィルター列",
+        "filter_text": "フィルター文字列",
+        "none_option": "（なし）",
+        "page_info": "{2:,} 行中 {0}–{1} 行",
+        "type_likert": "リッカート尺度",
+        "cramers_v": "クラメールのV = {:.4f}",
+        "expected_title": "期待度数",
+        "sparse_fisher": "期待度数の小さいセルが多いため、フィッシャーの正確検定のp値を使用（漸近p値 = {:.4f}）",
+        "sparse_perm": "期待度数の小さいセルが多いため、モンテカルロ並べ替え検定（{:,} 回）のp値を使用（漸近p値 = {:.4f}）",
+        "resample_label": "ブートストラップ信頼区間と並べ替えp値を計算",
+        "resample_count": "リサンプル回数",
+        "resample_running": "リサンプリング中...",
+        "boot_ci": "ブートストラップ {:.0%} 信頼区間 = [{:.4f}, {:.4f}]",
+        "boot_se": "ブートストラップ標準誤差 = {:.4f}",
+        "perm_pval": "並べ替えp値 = {:.4f}（{} 回）",
+        "design_title": "調査デザイン",
+        "weight_col": "ウェイト列",
+        "strata_col": "層（strata）列",
+        "weighted_note": "重み付き統計量。se_mean = デザインに基づく平均の標準誤差（線形化、層別）。",
+        "unweighted_note": "この項目はまだウェイト／層を使用していません（重みなしで計算）。",
+        "rao_scott": "重み付きデータのRao-Scott検定：カイ二乗を平均デザイン効果 = {:.3f} で割った値",
+        "design_se": "標準誤差（デザインベース） = {:.4f}",
+        "timing_panel": "⏱️ 段階ごとの処理時間を表示",
+        "timing_title": "段階ごとの処理時間（今回の再実行）",
+        "timing_total": "再実行の合計：{:.3f} 秒",
+        "wave_mode": "ウェーブ追加モード（新しい調査ウェーブを保存済み統計に統合）",
+        "wave_title": "調査ウェーブ",
+        "wave_resume": "保存済みウェーブ状態から再開（.npz、任意）",
+        "wave_files": "ウェーブファイルをアップロード（.xlsx/.csv、複数可）",
+        "wave_rows": "{} 行（{} ウェーブ）",
+        "wave_same_var": "異なる2つの変数を選んでください。",
+        "wave_mixed": "ウェーブモードではピアソン相関（数値×数値）とカイ二乗（カテゴリ×カテゴリ）が使えます。",
+        "wave_save": "ウェーブ状態をダウンロード（.npz）",
+        "wave_note": "要約統計のみを保持し、新しいウェーブはその行だけを処理します。四分位数は近似値（分位点スケッチ）で、スピアマンと並べ替え検定はこのモードでは使えません。",
+        "matrix_excluded": "カテゴリ数が {} を超える非数値列は既定では含まれません（必要なら手動で選択）：{}",
+        "matrix_skipped": "クロス表が {1:,} セルを超えるため {0} ペアをスキップしました。",
+        "wave_dropped": "カテゴリ数が {} を超える列はクロス表用に保持されません：{}",
+        "chi2_running": "カイ二乗検定を計算中...",
+        "sparse_asymptotic": "期待度数の小さいセルが多いものの、データが大きすぎて並べ替え検定ができないため、漸近p値を使用（精度が低い可能性あり）。",
+        "profile_title": "著者プロフィール",
+        "about_title": "アプリについて",
+        "about_content": "本アプリはStreamlitで作成され、調査データの自動分析が可能です。",
+    },
+    "简体中文": {
+        "title": "调查数据分析应用",
+        "file": "上传您的调查Excel/CSV文件",
+        "analysis_title": "数据分析",
+        "desc_title": "数据分布",
+        "desc_cols": "选择用于描述性分析的数字变量（直方图与箱线图）",
+        "hist": "直方图",
+        "box": "箱线图",
+        "preview": "数据预览",
+        "vra_title": "变量关系分析",
+        "vra_var1": "选择变量1",
+        "vra_var2": "选择变量2",
+        "type_num": "数字型", "type_cat": "分类型",
+        "cat_info": "分类型变量 → 卡方检验",
+        "num_info": "数字型变量 → 皮尔逊/斯皮尔曼相关性",
+        "corr_method_label": "选择相关性方法",
+        "pearson": "皮尔逊",
+        "spearman": "斯皮尔曼",
+        "result_cat_cat": "列联表",
+        "result_num_num": "相关性",
+        "chi2": "卡方值 = {:.4f}",
+        "pval": "显著性水平（p值）= {:.4f}",
+        "dof": "自由度 = {}",
+        "conclusion": "结论：",
+        "conclude_sig": "变量间存在显著关系 (p < {alpha})",
+        "conclude_nosig": "变量间不存在显著关系 (p >= {alpha})",
+        "corr_coef": "相关系数 = {:.4f}",
+        "corr_pval": "p值 = {:.4f}",
+        "corr_conclude_sig": "存在显著关系 (p < {alpha})",
+        "corr_conclude_nosig": "不存在显著关系 (p >= {alpha})",
+        "mix_info": "数字型 × 分类型变量 → 方差分析 / Kruskal-Wallis 检验",
+        "wait_file": "请上传您的调查数据文件。",
+        "stream_mode": "流式模式（超大文件，仅描述性统计）",
+        "stream_rows": "已读取 {:,} 行",
+        "stream_note": "流式模式仅显示描述性统计。如需图表和变量关系分析，请关闭此模式。",
+        "matrix_title": "关联矩阵（所有变量对）",
+        "matrix_enable": "计算所有变量对的关联",
+        "matrix_cols": "选择变量（留空 = 全部）",
+        "matrix_num": "数字型变量之间的相关性",
+        "matrix_cat": "分类型变量之间的卡方检验（效应量：克莱姆V）",
+        "matrix_none": "至少需要两个相同类型的变量。",
+        "alpha_label": "显著性水平（alpha）",
+        "adj_label": "多重检验校正",
+        "adj_none": "不校正",
+        "adj_bonferroni": "Bonferroni",
+        "adj_holm": "Holm",
+        "adj_bh": "Benjamini-Hochberg（FDR）",
+        "matrix_sig": "校正后 {1} 对中有 {0} 对显著",
+        "mix_method_label": "选择组间比较检验",
+        "anova": "单因素方差分析",
+        "kruskal": "Kruskal-Wallis 检验",
+        "result_mix": "组间比较",
+        "f_stat": "F = {:.4f}",
+        "h_stat": "H = {:.4f}",
+        "eta_sq": "Eta 平方 = {:.4f}",
+        "pb_corr": "点二列相关 = {:.4f} (p = {:.4f})",
+        "small_multiples": "将所有图表合并为一张图",
+        "page_size": "每页行数",
+        "page": "页码",
+        "preview_cols": "显示的列（留空 = 全部）",
+        "sort_by": "排序依据",
+        "sort_desc": "降序",
+        "filter_col": "筛选列",
+        "filter_text": "筛选文本",
+        "none_option": "（无）",
+        "page_info": "第 {}–{} 行，共 {:,} 行",
+        "type_likert": "李克特量表",
+        "cramers_v": "克莱姆V = {:.4f}",
+        "expected_title": "期望频数",
+        "sparse_fisher": "期望频数较小的单元格较多 → 使用Fisher精确检验的p值（渐近p值 = {:.4f}）",
+        "sparse_perm": "期望频数较小的单元格较多 → 使用蒙特卡洛置换检验的p值，{:,} 次置换（渐近p值 = {:.4f}）",
+        "resample_label": "计算自助法置信区间和置换检验p值",
+        "resample_count": "重抽样次数",
+        "resample_running": "正在重抽样...",
+        "boot_ci": "自助法 {:.0%} 置信区间 = [{:.4f}, {:.4f}]",
+        "boot_se": "自助法标准误 = {:.4f}",
+        "perm_pval": "置换检验p值 = {:.4f}（{} 次）",
+        "design_title": "调查设计",
+        "weight_col": "权重列",
+        "strata_col": "分层列",
+        "weighted_note": "加权统计量；se_mean = 基于设计的均值标准误（线性化，按层）。",
+        "unweighted_note": "此部分尚未使用权重/分层（按未加权计算）。",
+        "rao_scott": "加权数据的Rao-Scott检验：卡方除以平均设计效应 = {:.3f}",
+        "design_se": "标准误（基于设计） = {:.4f}",
+        "timing_panel": "⏱️ 显示各阶段耗时",
+        "timing_title": "各阶段耗时（本次运行）",
+        "timing_total": "本次运行总计：{:.3f} 秒",
+        "wave_mode": "追加批次模式（将新的调查批次合并到已存统计量）",
+        "wave_title": "调查批次",
+        "wave_resume": "从已保存的批次状态继续（.npz，可选）",
+        "wave_files": "上传批次文件（.xlsx/.csv，可多选）",
+        "wave_rows": "共 {} 行，来自 {} 个批次",
+        "wave_same_var": "请选择两个不同的变量。",
+        "wave_mixed": "批次模式提供皮尔逊相关（数值×数值）和卡方检验（分类×分类）。",
+        "wave_save": "下载批次状态（.npz）",
+        "wave_note": "只保存汇总统计量；每个新批次只处理自身的行。四分位数为近似值（分位数草图）；此模式不支持斯皮尔曼和置换检验。",
+        "matrix_excluded": "类别数超过 {} 的非数值列默认不包含（如需要请手动选择）：{}",
+        "matrix_skipped": "{} 对变量因交叉表超过 {:,} 个单元格而被跳过。",
+        "wave_dropped": "类别数超过 {} 的列不保留用于交叉表：{}",
+        "chi2_running": "正在计算卡方检验...",
+        "sparse_asymptotic": "期望频数较小的单元格较多，但数据量过大无法进行置换检验 → 使用渐近p值，可能不够准确。",
+        "profile_title": "作者简介",
+        "about_title": "关于应用",
+        "about_content": "本应用采用Streamlit开发，可自动分析调查数据、描述性分析与变量关系。",
+    }
+})
+
+# --- Data profil pembuat ---
+PROFILES = _freeze([
+    {
+        "name": {
+            "Indonesia": "Moh. Trisbintang A. Menu",
+            "English": "Moh. Trisbintang A. Menu",
+            "日本語": "Moh. Trisbintang A. Menu",
+            "简体中文": "Moh. Trisbintang A. Menu",
+        },
+        "img_file": "tris.jpeg",
+        "sid": {
+            "Indonesia": "SID: 004202400102",
+            "English": "SID: 004202400102",
+            "日本語": "SID: 004202400102",
+            "简体中文": "SID：004202400102",
+        },
+        "role": {
+            "Indonesia": "⚙️ Distribusi: Survei, bersihkan data, dashboard Streamlit (menu & navigasi)",
+            "English": "⚙️ Role: Survey, data cleaning, Streamlit dashboard (menu & navigation)",
+            "日本語": "⚙️ 役割：調査、データクリーニング、Streamlitダッシュボード",
+            "简体中文": "⚙️ 职责：调查、数据清洗、Streamlit仪表板",
+        },
+        "origin": {
+            "Indonesia": "Asal daerah: Gorontalo",
+            "English": "Origin: Gorontalo",
+            "日本語": "出身地：ゴロンタロ",
+            "简体中文": "来自：Gorontalo",
+        }
+    },
+    {
+        "name": {
+            "Indonesia": "Dwi Anfia Putri Wulandari",
+            "English": "Dwi Anfia Putri Wulandari",
+            "日本語": "Dwi Anfia Putri Wulandari",
+            "简体中文": "Dwi Anfia Putri Wulandari",
+        },
+        "img_file": "fia.jpeg",
+        "sid": {
+            "Indonesia": "SID: 004202400034",
+            "English": "SID: 004202400034",
+            "日本語": "SID: 004202400034",
+            "简体中文": "SID：004202400034",
+        },
+        "role": {
+            "Indonesia": "🛠️ Distribusi: Analisis dasar (histogram, boxplot), coding grafik Python, Streamlit bagian grafik",
+            "English": "🛠️ Role: Basic analysis (histogram, boxplot), Python chart coding, Streamlit graphics",
+            "日本語": "🛠️ 役割：基本分析、Pythonグラフ作成、Streamlitグラフィック",
+            "简体中文": "🛠️ 职责：基础分析、Python绘图、Streamlit图形部分",
+        },
+        "origin": {
+            "Indonesia": "Asal daerah: Bogor",
+            "English": "Origin: Bogor",
+            "日本語": "出身地：ボゴール",
+            "简体中文": "来自：Bogor",
+        }
+    },
+    {
+        "name": {
+            "Indonesia": "Gina Sonia",
+            "English": "Gina Sonia",
+            "日本語": "Gina Sonia",
+            "简体中文": "Gina Sonia",
+        },
+        "img_file": "gina.jpeg",
+        "sid": {
+            "Indonesia": "SID: 004202400076",
+            "English": "SID: 004202400076",
+            "日本語": "SID: 004202400076",
+            "简体中文": "SID：004202400076",
+        },
+        "role": {
+            "Indonesia": "🔧 Distribusi: Fokus laporan & bantu olah data",
+            "English": "🔧 Role: Focused on report & assist data processing",
+            "日本語": "🔧 役割：レポート担当・データ処理補助",
+            "简体中文": "🔧 职责：专注报告并协助数据处理",
+        },
+        "origin": {
+            "Indonesia": "Asal daerah: Cikampek",
+            "English": "Origin: Cikampek",
+            "日本語": "出身地：チカンペック",
+            "简体中文": "来自：Cikampek",
+        }
+    },
+    {
+        "name": {
+            "Indonesia": "Ananda Fasya Wiratama Putri",
+            "English": "Ananda Fasya Wiratama Putri",
+            "日本語": "Ananda Fasya Wiratama Putri",
+            "简体中文": "Ananda Fasya Wiratama Putri",
+        },
+        "img_file": "fasya.jpeg",
+        "sid": {
+            "Indonesia": "SID: 004202400107",
+            "English": "SID: 004202400107",
+            "日本語": "SID: 004202400107",
+            "简体中文": "SID：004202400107",
+        },
+        "role": {
+            "Indonesia": "⚡ Distribusi: Analisis hubungan variabel, penjelasan pengaruh medsos ke mental, Streamlit bagian analisis",
+            "English": "⚡ Role: Variable relationship analysis, explanation of social media effect on mental, Streamlit analysis",
+            "日本語": "⚡ 役割：変数関係分析、SNSの心理影響解説、Streamlit分析",
+            "简体中文": "⚡ 职责：变量关系分析，社交媒体对心理的影响，Streamlit分析部分",
+        },
+        "origin": {
+            "Indonesia": "Asal daerah: Depok",
+            "English": "Origin: Depok",
+            "日本語": "出身地：デポック",
+            "简体中文": "来自：Depok",
+        }
+    }
+])
@@ -0,0 +1,277 @@
+"""Ingest file survei: parse sekali per isi file, lalu dipakai ulang dari cache.
+
+Setelah parse pertama, workbook disimpan sebagai snapshot kolumnar (satu file
+``.npy`` per kolom + header ``meta.json``). Sesi/proses berikutnya membuka
+snapshot itu dengan memory-map read-only, jadi beberapa worker Streamlit
+berbagi halaman memori yang sama dan tidak perlu openpyxl lagi.
+"""
+import hashlib
+import io
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from cache import LRUCache
+
+# Batas memori default cache parse (bisa diubah lewat environment)
+PARSE_CACHE_MAX_BYTES = int(os.environ.get("SURVEY_PARSE_CACHE_MB", "1024")) * 1024 * 1024
+
+# Lokasi dan batas disk snapshot kolumnar
+SNAPSHOT_DIR = os.environ.get(
+    "SURVEY_SNAPSHOT_DIR", os.path.join(tempfile.gettempdir(), "survey_snapshots"))
+SNAPSHOT_MAX_BYTES = int(os.environ.get("SURVEY_SNAPSHOT_MB", "4096")) * 1024 * 1024
+SNAPSHOT_VERSION = 1
+
+# Jumlah baris per potongan pada mode streaming
+STREAM_CHUNK_ROWS = 50_000
+
+KIND_NUMERIC = "numeric"
+KIND_CATEGORICAL = "categorical"
+KIND_OTHER = "other"
+
+
+def file_fingerprint(data):
+    """Hash isi file (blake2b) sebagai kunci cache yang stabil antar rerun."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def file_format(file_name):
+    """Format file dari ekstensinya: ``"csv"`` atau ``"xlsx"``."""
+    return "csv" if str(file_name).lower().endswith(".csv") else "xlsx"
+
+
+def read_survey(data, sheet_name=0, fmt="xlsx"):
+    """Parse workbook Excel/CSV dari bytes menjadi DataFrame (jalur lambat)."""
+    if fmt == "csv":
+        return pd.read_csv(io.BytesIO(data))
+    return pd.read_excel(io.BytesIO(data), sheet_name=sheet_name)
+
+
+def iter_chunks(source, fmt="xlsx", chunk_rows=STREAM_CHUNK_ROWS, sheet_name=0):
+    """Baca file survei per potongan ``chunk_rows`` baris tanpa memuat semuanya.
+
+    ``source`` berupa path atau objek file. Untuk .xlsx dipakai openpyxl mode
+    read-only, untuk .csv ``pd.read_csv(chunksize=...)``.
+    """
+    if fmt == "csv":
+        yield from pd.read_csv(source, chunksize=chunk_rows)
+        return
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(source, read_only=True, data_only=True)
+    try:
+        if isinstance(sheet_name, int):
+            sheet = workbook.worksheets[sheet_name]
+        else:
+            sheet = workbook[sheet_name]
+        rows = sheet.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        columns = _unique_names(header)
+        buffer = []
+        for row in rows:
+            buffer.append(row[:len(columns)])
+            if len(buffer) >= chunk_rows:
+                yield pd.DataFrame.from_records(buffer, columns=columns)
+                buffer = []
+        if buffer:
+            yield pd.DataFrame.from_records(buffer, columns=columns)
+    finally:
+        workbook.close()
+
+
+def _unique_names(header):
+    # Sama seperti pandas: header kosong -> "Unnamed: i", duplikat -> "nama.1"
+    names, seen = [], {}
+    for i, name in enumerate(header):
+        name = f"Unnamed: {i}" if name is None else name
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+def column_kind(series):
+    """Jenis kolom: numerik, kategori, atau lainnya (tanggal/waktu)."""
+    dtype = series.dtype
+    if pd.api.types.is_bool_dtype(dtype):
+        return KIND_CATEGORICAL
+    if pd.api.types.is_numeric_dtype(dtype):
+        return KIND_NUMERIC
+    if pd.api.types.is_datetime64_any_dtype(dtype) or pd.api.types.is_timedelta64_dtype(dtype):
+        return KIND_OTHER
+    return KIND_CATEGORICAL
+
+
+def codes_dtype(n_categories):
+    # Sama dengan dtype kode yang dipilih pandas, agar from_codes tidak menyalin
+    for dtype in (np.int8, np.int16, np.int32):
+        if n_categories < np.iinfo(dtype).max:
+            return dtype
+    return np.int64
+
+
+def _json_value(value):
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+# --- Snapshot kolumnar ---
+def write_snapshot(df, path):
+    """Tulis ``df`` sebagai snapshot kolumnar di direktori ``path`` (atomik)."""
+    parent = os.path.dirname(path)
+    os.makedirs(parent, exist_ok=True)
+    tmp_path = tempfile.mkdtemp(dir=parent, prefix=".tmp-")
+    columns = []
+    try:
+        for i, name in enumerate(df.columns):
+            series = df.iloc[:, i]
+            kind = column_kind(series)
+            file_name = f"c{i}.npy"
+            entry = {"name": _json_value(name), "kind": kind, "file": file_name}
+            if kind == KIND_CATEGORICAL:
+                codes, uniques = pd.factorize(series, sort=True)
+                entry["categories"] = [_json_value(v) for v in uniques]
+                values = codes.astype(codes_dtype(len(uniques)))
+            else:
+                values = np.ascontiguousarray(series.to_numpy())
+            entry["dtype"] = values.dtype.str
+            np.save(os.path.join(tmp_path, file_name), values, allow_pickle=False)
+            columns.append(entry)
+        meta = {"version": SNAPSHOT_VERSION, "rows": len(df), "columns": columns}
+        with open(os.path.join(tmp_path, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+        try:
+            os.replace(tmp_path, path)
+        except OSError:
+            # Proses lain sudah menulis snapshot yang sama lebih dulu
+            shutil.rmtree(tmp_path, ignore_errors=True)
+    except BaseException:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        raise
+    return path
+
+
+def read_snapshot_meta(path):
+    with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def open_snapshot(path):
+    """Buka snapshot sebagai DataFrame yang kolomnya di-memory-map read-only."""
+    meta = read_snapshot_meta(path)
+    data = {}
+    for entry in meta["columns"]:
+        values = np.load(os.path.join(path, entry["file"]), mmap_mode="r", allow_pickle=False)
+        if entry["kind"] == KIND_CATEGORICAL:
+            values = pd.Categorical.from_codes(values, categories=entry["categories"])
+        data[entry["name"]] = values
+    df = pd.DataFrame(data, copy=False)
+    df.attrs["snapshot_meta"] = meta
+    return df
+
+
+class SnapshotStore:
+    """Kumpulan snapshot di disk dengan batas ukuran (yang paling lama dipakai dihapus)."""
+
+    def __init__(self, root=SNAPSHOT_DIR, max_bytes=SNAPSHOT_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+
+    def path_for(self, fingerprint, sheet_name=0):
+        return os.path.join(self.root, f"{fingerprint}-{sheet_name}")
+
+    def load(self, fingerprint, sheet_name=0):
+        """Buka snapshot jika ada dan versinya cocok, selain itu ``None``.
+
+        Snapshot yang usang (versi lain) atau rusak dihapus, supaya ``save``
+        berikutnya bisa menggantinya (``os.replace`` tidak menimpa direktori
+        yang berisi).
+        """
+        path = self.path_for(fingerprint, sheet_name)
+        if not os.path.isdir(path):
+            return None
+        try:
+            current = read_snapshot_meta(path).get("version") == SNAPSHOT_VERSION
+            df = open_snapshot(path) if current else None
+        except (OSError, ValueError, KeyError):
+            df = None
+        if df is None:
+            shutil.rmtree(path, ignore_errors=True)
+            return None
+        os.utime(path)
+        return df
+
+    def save(self, fingerprint, df, sheet_name=0):
+        path = write_snapshot(df, self.path_for(fingerprint, sheet_name))
+        self.prune(keep=path)
+        return path
+
+    def prune(self, keep=None):
+        """Hapus snapshot paling lama dipakai sampai total ukuran di bawah batas."""
+        if not os.path.isdir(self.root):
+            return
+        entries = []
+        for name in os.listdir(self.root):
+            path = os.path.join(self.root, name)
+            if name.startswith(".") or not os.path.isdir(path):
+                continue
+            size = sum(e.stat().st_size for e in os.scandir(path) if e.is_file())
+            entries.append((os.path.getmtime(path), size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+
+
+class ParseCache:
+    """Cache hasil parse workbook, dikunci dengan (hash isi, sheet, opsi).
+
+    Urutan pencarian: memori proses -> snapshot mmap di disk -> openpyxl.
+    """
+
+    def __init__(self, max_bytes=PARSE_CACHE_MAX_BYTES, snapshots=None):
+        self.frames = LRUCache(max_bytes=max_bytes)
+        self.snapshots = snapshots if snapshots is not None else SnapshotStore()
+        self.snapshot_hits = 0
+
+    def load(self, data, sheet_name=0, fmt="xlsx"):
+        """Kembalikan ``(fingerprint, df)``; openpyxl hanya dipanggil saat miss."""
+        fingerprint = file_fingerprint(data)
+        key = (fingerprint, sheet_name)
+        df = self.frames.get_or_compute(
+            key, lambda: self._load_uncached(fingerprint, data, sheet_name, fmt))
+        return fingerprint, df
+
+    def _load_uncached(self, fingerprint, data, sheet_name, fmt):
+        df = self.snapshots.load(fingerprint, sheet_name)
+        if df is not None:
+            self.snapshot_hits += 1
+            return df
+        df = read_survey(data, sheet_name, fmt)
+        try:
+            self.snapshots.save(fingerprint, df, sheet_name)
+        except (OSError, ValueError):
+            return df
+        mapped = self.snapshots.load(fingerprint, sheet_name)
+        return mapped if mapped is not None else df
+
+    def stats(self):
+        stats = self.frames.stats()
+        stats["snapshot_hits"] = self.snapshot_hits
+        return stats
@@ -0,0 +1,121 @@
+"""Pencatat waktu dan puncak memori per tahap untuk satu rerun aplikasi.
+
+Contoh::
+
+    timer = StageTimer(trace_memory=True)
+    with timer.span("read_excel"):
+        df = pd.read_excel(data)
+    timer.finish()
+    timer.records   # [{"stage": "read_excel", "seconds": ..., "peak_mb": ..., "depth": 0}]
+
+Puncak memori diambil dari ``tracemalloc`` (alokasi Python dan NumPy/pandas)
+dan hanya aktif bila diminta, karena pelacakan memperlambat alokasi. Angka
+ini berlaku untuk seluruh proses: rerun sesi lain yang berjalan bersamaan
+ikut terhitung. Bila ``SURVEY_TIMING_LOG`` diisi, setiap rerun bisa ditulis
+sebagai satu baris JSON ke file tersebut.
+"""
+import json
+import os
+import threading
+import time
+import tracemalloc
+import weakref
+from contextlib import contextmanager
+
+TIMING_LOG_PATH = os.environ.get("SURVEY_TIMING_LOG") or None
+
+_MB = 1024 * 1024
+_log_lock = threading.Lock()
+_tracing_lock = threading.Lock()
+_tracing_users = 0
+_tracing_owned = False
+
+
+def _start_tracing():
+    global _tracing_users, _tracing_owned
+    with _tracing_lock:
+        if _tracing_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _tracing_owned = True
+        _tracing_users += 1
+
+
+def _stop_tracing():
+    # Hanya hentikan pelacakan yang dimulai modul ini, setelah pemakai terakhir selesai
+    global _tracing_users, _tracing_owned
+    with _tracing_lock:
+        _tracing_users -= 1
+        if _tracing_users == 0 and _tracing_owned:
+            tracemalloc.stop()
+            _tracing_owned = False
+
+
+class StageTimer:
+    """Kumpulkan span waktu (boleh bersarang) selama satu rerun."""
+
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.records = []
+        self.started = time.time()
+        self._start = time.perf_counter()
+        self._stack = []
+        self._release = None
+        if trace_memory:
+            _start_tracing()
+            # Rerun yang terputus (tanpa finish()) tetap melepas pelacakan saat objek dibuang
+            self._release = weakref.finalize(self, _stop_tracing)
+
+    @contextmanager
+    def span(self, stage):
+        record = {"stage": stage, "seconds": 0.0, "peak_mb": None, "depth": len(self._stack)}
+        self.records.append(record)
+        frame = {"base": 0, "peak": 0}
+        if self.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                # Simpan puncak induk sebelum direset untuk span ini
+                parent = self._stack[-1]
+                parent["peak"] = max(parent["peak"], peak)
+            tracemalloc.reset_peak()
+            frame = {"base": current, "peak": current}
+        self._stack.append(frame)
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["seconds"] = time.perf_counter() - start
+            self._stack.pop()
+            if self.trace_memory:
+                peak = max(frame["peak"], tracemalloc.get_traced_memory()[1])
+                record["peak_mb"] = (peak - frame["base"]) / _MB
+                if self._stack:
+                    self._stack[-1]["peak"] = max(self._stack[-1]["peak"], peak)
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self._start
+
+    def summary(self):
+        """Total per tahap teratas (span bersarang sudah termasuk di induknya)."""
+        totals = {}
+        for record in self.records:
+            if record["depth"] == 0:
+                totals[record["stage"]] = totals.get(record["stage"], 0.0) + record["seconds"]
+        return totals
+
+    def finish(self):
+        if self._release is not None:
+            self._release()
+
+    def write_jsonl(self, path=TIMING_LOG_PATH, **context):
+        """Tambahkan satu baris JSON berisi semua span rerun ini ke ``path``."""
+        if not path:
+            return
+        line = {
+            "time": self.started,
+            "total_seconds": self.elapsed,
+            **context,
+            "stages": self.records,
+        }
+        with _log_lock, open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(line, ensure_ascii=False, default=str) + "\n")
@@ -0,0 +1,68 @@
+"""Preview data per halaman: hanya jendela baris yang terlihat yang dikirim ke browser."""
+import numpy as np
+
+from cache import LRUCache
+
+PAGE_SIZES = (25, 50, 100, 500)
+PREVIEW_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+def sort_order(series, ascending=True):
+    """Posisi baris setelah diurutkan (stabil, nilai kosong di akhir)."""
+    values = series.reset_index(drop=True)
+    return values.sort_values(ascending=ascending, kind="stable", na_position="last").index.to_numpy()
+
+
+def filter_mask(series, text):
+    """Masker baris yang nilainya memuat ``text`` (tanpa membedakan huruf besar/kecil)."""
+    return series.astype(str).str.contains(text, case=False, regex=False, na=False).to_numpy()
+
+
+class PreviewPager:
+    """Potong DataFrame menjadi halaman; urutan, filter dan halaman di-cache."""
+
+    def __init__(self, cache=None):
+        self.cache = cache if cache is not None else LRUCache(max_bytes=PREVIEW_CACHE_MAX_BYTES)
+
+    def positions(self, fingerprint, df, sort_by=None, ascending=True, filter_col=None, filter_text=""):
+        """Posisi baris (setelah sort dan filter) yang masuk ke preview."""
+        if sort_by is not None:
+            order = self.cache.get_or_compute(
+                (fingerprint, "preview_order", sort_by, ascending),
+                lambda: sort_order(df[sort_by], ascending))
+        else:
+            order = None
+        if filter_col is not None and filter_text:
+            mask = self.cache.get_or_compute(
+                (fingerprint, "preview_filter", filter_col, filter_text),
+                lambda: filter_mask(df[filter_col], filter_text))
+            if order is None:
+                return np.flatnonzero(mask)
+            return order[mask[order]]
+        return order if order is not None else np.arange(len(df))
+
+    def page(self, fingerprint, df, start, size, columns=None, sort_by=None, ascending=True,
+             filter_col=None, filter_text=""):
+        """Kembalikan ``(halaman, jumlah_baris_total)`` untuk baris ``start .. start+size``."""
+        columns = tuple(columns) if columns else tuple(df.columns)
+        key = (fingerprint, "preview_page", start, size, columns, sort_by, ascending, filter_col, filter_text)
+
+        def compute():
+            positions = self.positions(fingerprint, df, sort_by, ascending, filter_col, filter_text)
+            col_idx = [df.columns.get_loc(c) for c in columns]
+            window = df.iloc[positions[start:start + size], col_idx]
+            return window, len(positions)
+
+        return self.cache.get_or_compute(key, compute)
+
+
+def page_count(total_rows, size):
+    return max(1, -(-total_rows // size))
+
+
+def page_label_range(start, size, total_rows):
+    """Rentang baris (1-based) untuk label halaman."""
+    if total_rows == 0:
+        return 0, 0
+    return start + 1, min(start + size, total_rows)
+
@@ -1,9 +1,11 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-from scipy.stats import chi2_contingency, pearsonr, spearmanr
-import matplotlib.pyplot as plt
 import os
+import uuid
+
+# Modul analisis (pandas, SciPy, matplotlib) diimpor di halaman yang memakainya;
+# halaman profil dan tentang aplikasi tidak perlu memuatnya
+from content import LANGUAGE_FLAGS, LANGUAGES, PROFILE_IMAGE_WIDTH, PROFILES, SIDEBAR_MENU, TEXT, thumbnail
+from instrumentation import StageTimer
 
 # --- THEME: Teknik/Engineering Blue/Yellow, Card tebal, font digital ---
 st.set_page_config(page_title="Aplikasi Analisis Data Survei", layout="wide")
@@ -63,297 +65,67 @@ st.markdown("""
 
 BASE_DIR = os.path.dirname(__file__)
 
+
+# --- Cache parse workbook (dibagi semua sesi dalam satu proses) ---
+@st.cache_resource
+def get_parse_cache():
+    from ingest import ParseCache
+    return ParseCache()
+
+
+# --- Cache hasil analisis (kunci: fingerprint dataset, analisis, kolom, metode) ---
+@st.cache_resource
+def get_result_cache():
+    from analysis import RESULT_CACHE_MAX_ENTRIES
+    from cache import LRUCache
+    return LRUCache(max_entries=RESULT_CACHE_MAX_ENTRIES)
+
+
+# --- Renderer grafik (PNG di-cache per dataset, kolom, tema) ---
+@st.cache_resource
+def get_chart_renderer():
+    from charts import ChartRenderer
+    return ChartRenderer()
+
+
+# --- Cache halaman preview data ---
+@st.cache_resource
+def get_preview_pager():
+    from preview import PreviewPager
+    return PreviewPager()
+
+
+# --- Thumbnail foto profil (dibuat sekali per proses dari JPEG asli) ---
+@st.cache_resource
+def get_profile_thumbnail(path, mtime):
+    return thumbnail(path)
+
+
 # --- Bahasa & bendera (sidebar) ---
-languages = ["Indonesia", "English", "日本語", "简体中文"]
-language_flags = {
-    "Indonesia": "🇮🇩",
-    "English": "🇬🇧",
-    "日本語": "🇯🇵",
-    "简体中文": "🇨🇳"
-}
-languages_w_flag = [f"{language_flags[lang]}  {lang}" for lang in languages]
+languages_w_flag = [f"{LANGUAGE_FLAGS[lang]}  {lang}" for lang in LANGUAGES]
 selected_lang_label = st.sidebar.selectbox(
     "🌐 Pilih Bahasa / Choose Language / 言語選択 / 选择语言", languages_w_flag)
 lang = selected_lang_label.split(maxsplit=1)[-1]
 
-sidebar_menu = {
-    "Indonesia": ["Profil Pembuat", "Analisis Data", "Tentang Aplikasi"],
-    "English": ["Author Profile", "Data Analysis", "About App"],
-    "日本語": ["著者プロフィール", "データ分析", "アプリについて"],
-    "简体中文": ["作者简介", "数据分析", "关于应用"],
-}
-menu_items = sidebar_menu.get(lang, sidebar_menu["Indonesia"])
+menu_items = SIDEBAR_MENU.get(lang, SIDEBAR_MENU["Indonesia"])
 menu = st.sidebar.radio("Menu", menu_items)
 
-# --- Multilanguage dictionary untuk semua label/instruksi dan output ---
-text = {
-    "Indonesia": {
-        "title": "Aplikasi Analisis Data Survei",
-        "file": "Upload file Excel data survei",
-        "analysis_title": "Analisis Data",
-        "desc_title": "Distribusi Data",
-        "desc_cols": "Pilih variabel numerik untuk analisis deskriptif (histogram & boxplot)",
-        "hist": "Histogram",
-        "box": "Boxplot",
-        "preview": "Preview Data",
-        "vra_title": "Analisis Hubungan Variabel",
-        "vra_var1": "Pilih Variabel 1",
-        "vra_var2": "Pilih Variabel 2",
-        "type_num": "Numerik", "type_cat": "Kategori",
-        "cat_info": "Variabel kategorik → menggunakan Chi-Square",
-        "num_info": "Variabel numerik → korelasi Pearson/Spearman",
-        "corr_method_label": "Pilih metode korelasi",
-        "pearson": "Pearson",
-        "spearman": "Spearman",
-        "result_cat_cat": "Tabel Kontingensi",
-        "result_num_num": "Korelasi",
-        "chi2": "Chi2 = {:.4f}",
-        "pval": "P-value = {:.4f}",
-        "dof": "Degrees of freedom = {}",
-        "conclusion": "Kesimpulan:",
-        "conclude_sig": "Terdapat hubungan signifikan antara variabel (p < 0.05)",
-        "conclude_nosig": "Tidak terdapat hubungan signifikan antara variabel (p >= 0.05)",
-        "corr_coef": "Koefisien = {:.4f}",
-        "corr_pval": "P-value = {:.4f}",
-        "corr_conclude_sig": "Terdapat hubungan signifikan (p < 0.05)",
-        "corr_conclude_nosig": "Tidak terdapat hubungan signifikan (p >= 0.05)",
-        "mix_info": "Kombinasi belum didukung untuk analisis otomatis.",
-        "wait_file": "Silakan upload file Excel data survei.",
-        "profile_title": "Profil Pembuat",
-        "about_title": "Tentang Aplikasi",
-        "about_content": "Aplikasi ini dibuat menggunakan Streamlit untuk menganalisis data survei (Excel), analisis deskriptif, dan analisis hubungan variabel otomatis.",
-    },
-    "English": {
-        "title": "Survey Data Analysis App",
-        "file": "Upload your survey Excel file",
-        "analysis_title": "Data Analysis",
-        "desc_title": "Data Distribution",
-        "desc_cols": "Select numeric variables for descriptive analysis (histogram & boxplot)",
-        "hist": "Histogram",
-        "box": "Boxplot",
-        "preview": "Preview Data",
-        "vra_title": "Variable Relationship Analysis",
-        "vra_var1": "Select Variable 1",
-        "vra_var2": "Select Variable 2",
-        "type_num": "Numeric", "type_cat": "Category",
-        "cat_info": "Categorical variables → Chi-Square test",
-        "num_info": "Numeric variables → Pearson/Spearman correlation",
-        "corr_method_label": "Select correlation method",
-        "pearson": "Pearson",
-        "spearman": "Spearman",
-        "result_cat_cat": "Contingency Table",
-        "result_num_num": "Correlation",
-        "chi2": "Chi2 = {:.4f}",
-        "pval": "P-value = {:.4f}",
-        "dof": "Degrees of freedom = {}",
-        "conclusion": "Conclusion:",
-        "conclude_sig": "Significant relationship between variables (p < 0.05)",
-        "conclude_nosig": "No significant relationship between variables (p >= 0.05)",
-        "corr_coef": "Coefficient = {:.4f}",
-        "corr_pval": "P-value = {:.4f}",
-        "corr_conclude_sig": "Significant relationship (p < 0.05)",
-        "corr_conclude_nosig": "No significant relationship (p >= 0.05)",
-        "mix_info": "The combination is not supported yet.",
-        "wait_file": "Please upload your Excel survey file.",
-        "profile_title": "Author Profile",
-        "about_title": "About App",
-        "about_content": "This app is built using Streamlit to analyze survey data, descriptive analysis, and variable relationships automatically.",
-    },
-    "日本語": {
-        "title": "調査データ分析アプリ",
-        "file": "Excel調査ファイルをアップロード",
-        "analysis_title": "データ分析",
-        "desc_title": "データ分布",
-        "desc_cols": "記述分析用の数値変数を選択（ヒストグラム＆箱ひげ図）",
-        "hist": "ヒストグラム",
-        "box": "箱ひげ図",
-        "preview": "データプレビュー",
-        "vra_title": "変数の関係分析",
-        "vra_var1": "変数1を選択",
-        "vra_var2": "変数2を選択",
-        "type_num": "数値型", "type_cat": "カテゴリ型",
-        "cat_info": "カテゴリ型変数 → カイ二乗検定",
-        "num_info": "数値型変数 → ピアソン/スピアマン相関",
-        "corr_method_label": "相関係数の種類を選ぶ",
-        "pearson": "ピアソン",
-        "spearman": "スピアマン",
-        "result_cat_cat": "クロス集計表",
-        "result_num_num": "相関",
-        "chi2": "カイ二乗 = {:.4f}",
-        "pval": "p値 = {:.4f}",
-        "dof": "自由度 = {}",
-        "conclusion": "結論：",
-        "conclude_sig": "変数間に有意な関係あり (p < 0.05)",
-        "conclude_nosig": "変数間に有意な関係なし (p >= 0.05)",
-        "corr_coef": "相関係数 = {:.4f}",
-        "corr_pval": "p値 = {:.4f}",
-        "corr_conclude_sig": "有意な関係あり (p < 0.05)",
-        "corr_conclude_nosig": "有意な関係なし (p >= 0.05)",
-        "mix_info": "混合変数の自動分析は未対応です。",
-        "wait_file": "調査ファイルをアップロードしてください。",
-        "profile_title": "著者プロフィール",
-        "about_title": "アプリについて",
-        "about_content": "本アプリはStreamlitで作成され、調査データの自動分析が可能です。",
-    },
-    "简体中文": {
-        "title": "调查数据分析应用",
-        "file": "上传您的调查Excel文件",
-        "analysis_title": "数据分析",
-        "desc_title": "数据分布",
-        "desc_cols": "选择用于描述性分析的数字变量（直方图与箱线图）",
-        "hist": "直方图",
-        "box": "箱线图",
-        "preview": "数据预览",
-        "vra_title": "变量关系分析",
-        "vra_var1": "选择变量1",
-        "vra_var2": "选择变量2",
-        "type_num": "数字型", "type_cat": "分类型",
-        "cat_info": "分类型变量 → 卡方检验",
-        "num_info": "数字型变量 → 皮尔逊/斯皮尔曼相关性",
-        "corr_method_label": "选择相关性方法",
-        "pearson": "皮尔逊",
-        "spearman": "斯皮尔曼",
-        "result_cat_cat": "列联表",
-        "result_num_num": "相关性",
-        "chi2": "卡方值 = {:.4f}",
-        "pval": "显著性水平（p值）= {:.4f}",
-        "dof": "自由度 = {}",
-        "conclusion": "结论：",
-        "conclude_sig": "变量间存在显著关系 (p < 0.05)",
-        "conclude_nosig": "变量间不存在显著关系 (p >= 0.05)",
-        "corr_coef": "相关系数 = {:.4f}",
-        "corr_pval": "p值 = {:.4f}",
-        "corr_conclude_sig": "存在显著关系 (p < 0.05)",
-        "corr_conclude_nosig": "不存在显著关系 (p >= 0.05)",
-        "mix_info": "混合变量暂不支持自动分析。",
-        "wait_file": "请上传您的调查数据文件。",
-        "profile_title": "作者简介",
-        "about_title": "关于应用",
-        "about_content": "本应用采用Streamlit开发，可自动分析调查数据、描述性分析与变量关系。",
-    }
-}
-tt = text.get(lang, text["Indonesia"])
-
-profile_data = [
-    {
-        "name": {
-            "Indonesia": "Moh. Trisbintang A. Menu",
-            "English": "Moh. Trisbintang A. Menu",
-            "日本語": "Moh. Trisbintang A. Menu",
-            "简体中文": "Moh. Trisbintang A. Menu",
-        },
-        "img_file": "tris.jpeg",
-        "sid": {
-            "Indonesia": "SID: 004202400102",
-            "English": "SID: 004202400102",
-            "日本語": "SID: 004202400102",
-            "简体中文": "SID：004202400102",
-        },
-        "role": {
-            "Indonesia": "⚙️ Distribusi: Survei, bersihkan data, dashboard Streamlit (menu & navigasi)",
-            "English": "⚙️ Role: Survey, data cleaning, Streamlit dashboard (menu & navigation)",
-            "日本語": "⚙️ 役割：調査、データクリーニング、Streamlitダッシュボード",
-            "简体中文": "⚙️ 职责：调查、数据清洗、Streamlit仪表板",
-        },
-        "origin": {
-            "Indonesia": "Asal daerah: Gorontalo",
-            "English": "Origin: Gorontalo",
-            "日本語": "出身地：ゴロンタロ",
-            "简体中文": "来自：Gorontalo",
-        }
-    },
-    {
-        "name": {
-            "Indonesia": "Dwi Anfia Putri Wulandari",
-            "English": "Dwi Anfia Putri Wulandari",
-            "日本語": "Dwi Anfia Putri Wulandari",
-            "简体中文": "Dwi Anfia Putri Wulandari",
-        },
-        "img_file": "fia.jpeg",
-        "sid": {
-            "Indonesia": "SID: 004202400034",
-            "English": "SID: 004202400034",
-            "日本語": "SID: 004202400034",
-            "简体中文": "SID：004202400034",
-        },
-        "role": {
-            "Indonesia": "🛠️ Distribusi: Analisis dasar (histogram, boxplot), coding grafik Python, Streamlit bagian grafik",
-            "English": "🛠️ Role: Basic analysis (histogram, boxplot), Python chart coding, Streamlit graphics",
-            "日本語": "🛠️ 役割：基本分析、Pythonグラフ作成、Streamlitグラフィック",
-            "简体中文": "🛠️ 职责：基础分析、Python绘图、Streamlit图形部分",
-        },
-        "origin": {
-            "Indonesia": "Asal daerah: Bogor",
-            "English": "Origin: Bogor",
-            "日本語": "出身地：ボゴール",
-            "简体中文": "来自：Bogor",
-        }
-    },
-    {
-        "name": {
-            "Indonesia": "Gina Sonia",
-            "English": "Gina Sonia",
-            "日本語": "Gina Sonia",
-            "简体中文": "Gina Sonia",
-        },
-        "img_file": "gina.jpeg",
-        "sid": {
-            "Indonesia": "SID: 004202400076",
-            "English": "SID: 004202400076",
-            "日本語": "SID: 004202400076",
-            "简体中文": "SID：004202400076",
-        },
-        "role": {
-            "Indonesia": "🔧 Distribusi: Fokus laporan & bantu olah data",
-            "English": "🔧 Role: Focused on report & assist data processing",
-            "日本語": "🔧 役割：レポート担当・データ処理補助",
-            "简体中文": "🔧 职责：专注报告并协助数据处理",
-        },
-        "origin": {
-            "Indonesia": "Asal daerah: Cikampek",
-            "English": "Origin: Cikampek",
-            "日本語": "出身地：チカンペック",
-            "简体中文": "来自：Cikampek",
-        }
-    },
-    {
-        "name": {
-            "Indonesia": "Ananda Fasya Wiratama Putri",
-            "English": "Ananda Fasya Wiratama Putri",
-            "日本語": "Ananda Fasya Wiratama Putri",
-            "简体中文": "Ananda Fasya Wiratama Putri",
-        },
-        "img_file": "fasya.jpeg",
-        "sid": {
-            "Indonesia": "SID: 004202400107",
-            "English": "SID: 004202400107",
-            "日本語": "SID: 004202400107",
-            "简体中文": "SID：004202400107",
-        },
-        "role": {
-            "Indonesia": "⚡ Distribusi: Analisis hubungan variabel, penjelasan pengaruh medsos ke mental, Streamlit bagian analisis",
-            "English": "⚡ Role: Variable relationship analysis, explanation of social media effect on mental, Streamlit analysis",
-            "日本語": "⚡ 役割：変数関係分析、SNSの心理影響解説、Streamlit分析",
-            "简体中文": "⚡ 职责：变量关系分析，社交媒体对心理的影响，Streamlit分析部分",
-        },
-        "origin": {
-            "Indonesia": "Asal daerah: Depok",
-            "English": "Origin: Depok",
-            "日本語": "出身地：デポック",
-            "简体中文": "来自：Depok",
-        }
-    }
-]
+tt = TEXT.get(lang, TEXT["Indonesia"])
+
+# --- Instrumentasi: waktu dan puncak memori per tahap untuk rerun ini ---
+show_timing = st.sidebar.checkbox(tt["timing_panel"], key="timing_panel")
+timer = StageTimer(trace_memory=show_timing)
 
 # --- MAIN CONTENT ---
 if menu == menu_items[0]:
     st.markdown(f"<div class='stTitleMain'>{tt['profile_title']}</div>", unsafe_allow_html=True)
-    for prof in profile_data:
+    for prof in PROFILES:
         st.markdown("<div class='stCard'>", unsafe_allow_html=True)
         cols = st.columns([1,3])
         with cols[0]:
             img_path = os.path.join(BASE_DIR, prof["img_file"])
-            st.image(img_path, width=265)
+            with timer.span("profile_image"):
+                st.image(get_profile_thumbnail(img_path, os.path.getmtime(img_path)), width=PROFILE_IMAGE_WIDTH)
         with cols[1]:
             st.markdown(f"<div class='stProfileName'>{prof['name'][lang]} ⚙️</div>", unsafe_allow_html=True)
             st.markdown(f"<div class='stProfileRole'>{prof['role'][lang]}</div>", unsafe_allow_html=True)
@@ -363,148 +135,392 @@ if menu == menu_items[0]:
         st.markdown("<hr>", unsafe_allow_html=True)
 
 elif menu == menu_items[1]:
+    from analysis import (MATRIX_DEFAULT_MAX_LEVELS, MATRIX_MAX_CELLS, METHOD_PEARSON, METHOD_SPEARMAN, TEST_FISHER,
+                          TEST_PERMUTATION, AnalysisEngine, matrix_default_columns, matrix_pairs)
+    from ingest import KIND_NUMERIC, file_fingerprint, file_format, iter_chunks
+    from preview import PAGE_SIZES, page_count, page_label_range
+    from resampling import RESAMPLE_COUNTS
+    from significance import CORRECTIONS, DEFAULT_ALPHA, add_adjusted, adjust_pvalues, significant
+    from sketches import StreamingSummary
+    from waves import WaveAccumulator
+    from weighting import TEST_RAO_SCOTT
+
+    parse_cache = get_parse_cache()
     st.markdown(f"<div class='stTitleMain'>{tt['analysis_title']}</div>", unsafe_allow_html=True)
-    uploaded_file = st.file_uploader(tt["file"], type=["xlsx"])
-    if uploaded_file:
-        df = pd.read_excel(uploaded_file)
+    # Pengaturan signifikansi (dipakai semua uji di halaman ini)
+    with st.sidebar:
+        alpha = st.number_input(tt["alpha_label"], min_value=0.001, max_value=0.2,
+                                value=DEFAULT_ALPHA, step=0.005, format="%.3f")
+        correction_labels = [tt["adj_none"], tt["adj_bonferroni"], tt["adj_holm"], tt["adj_bh"]]
+        correction_label = st.selectbox(tt["adj_label"], correction_labels, index=3)
+        correction = CORRECTIONS[correction_labels.index(correction_label)]
+    uploaded_file = st.file_uploader(tt["file"], type=["xlsx", "csv"])
+    stream_mode = st.checkbox(tt["stream_mode"])
+    wave_mode = st.checkbox(tt["wave_mode"], key="wave_mode")
+    if wave_mode:
+        # --- Mode tambah gelombang: hanya baris gelombang baru yang diproses ---
+        st.markdown(f"<div class='stSubHeader'>{tt['wave_title']}</div>", unsafe_allow_html=True)
+        st.markdown("<div class='stCard'>", unsafe_allow_html=True)
+        waves = st.session_state.setdefault("wave_accumulator", WaveAccumulator())
+        resume_file = st.file_uploader(tt["wave_resume"], type=["npz"], key="wave_resume")
+        if resume_file is not None:
+            resume_id = file_fingerprint(resume_file.getvalue())
+            if st.session_state.get("wave_resume_id") != resume_id:
+                waves = st.session_state["wave_accumulator"] = WaveAccumulator.from_bytes(resume_file.getvalue())
+                st.session_state["wave_resume_id"] = resume_id
+        wave_files = st.file_uploader(tt["wave_files"], type=["xlsx", "csv"], accept_multiple_files=True,
+                                      key="wave_files")
+        for wave_file in wave_files or []:
+            wave_data = wave_file.getvalue()
+            wave_id = file_fingerprint(wave_data)
+            if wave_id in waves:
+                continue
+            with timer.span("add_wave"):
+                _, wave_df = parse_cache.load(wave_data, fmt=file_format(wave_file.name))
+                waves.add(wave_df, wave_id, wave_file.name)
+        st.caption(tt["wave_rows"].format(waves.rows, len(waves.waves)))
+        if waves.high_cardinality:
+            st.caption(tt["wave_dropped"].format(waves.max_levels, ", ".join(map(str, waves.high_cardinality))))
+        if waves.waves:
+            st.dataframe(waves.wave_table(), hide_index=True)
+            wave_desc_cols = st.multiselect(tt["desc_cols"], waves.numeric, key="wave_desc_cols")
+            if wave_desc_cols:
+                st.dataframe(waves.describe(wave_desc_cols))
+            colW1, colW2 = st.columns(2)
+            with colW1:
+                wave_x1 = st.selectbox(tt["vra_var1"], waves.numeric + waves.categorical, key="wave_x1")
+            with colW2:
+                wave_x2 = st.selectbox(tt["vra_var2"], waves.numeric + waves.categorical,
+                                       index=1 if len(waves.numeric + waves.categorical) > 1 else 0, key="wave_x2")
+            if wave_x1 == wave_x2:
+                st.info(tt["wave_same_var"])
+            elif wave_x1 in waves.numeric and wave_x2 in waves.numeric:
+                wave_corr = waves.correlation(wave_x1, wave_x2)
+                st.subheader(f"{tt['result_num_num']} ({tt['pearson']})")
+                st.write(tt["corr_coef"].format(wave_corr["coef"]))
+                st.write(tt["corr_pval"].format(wave_corr["p"]))
+            elif wave_x1 in waves.categorical and wave_x2 in waves.categorical:
+                wave_chi = waves.crosstab_chi2(wave_x1, wave_x2)
+                st.subheader(tt["result_cat_cat"])
+                st.dataframe(wave_chi["table"])
+                st.write(tt["chi2"].format(wave_chi["chi2"]))
+                st.write(tt["pval"].format(wave_chi["p"]))
+                st.write(tt["dof"].format(wave_chi["dof"]))
+                st.write(tt["cramers_v"].format(wave_chi["cramers_v"]))
+                if wave_chi["test"] == TEST_FISHER:
+                    st.info(tt["sparse_fisher"].format(wave_chi["p_asymptotic"]))
+            else:
+                st.info(tt["wave_mixed"])
+            st.download_button(tt["wave_save"], waves.to_bytes(), file_name="survey_waves.npz",
+                               mime="application/octet-stream")
+        st.markdown("</div>", unsafe_allow_html=True)
+        st.info(tt["wave_note"])
+    elif uploaded_file and stream_mode:
+        # --- Mode streaming: baca per potongan, statistik deskriptif diperbarui bertahap ---
+        st.markdown(f"<div class='stSubHeader'>{tt['desc_title']}</div>", unsafe_allow_html=True)
+        st.markdown("<div class='stCard'>", unsafe_allow_html=True)
+        stream_progress = st.empty()
+        stream_table = st.empty()
+        summary = StreamingSummary()
+        uploaded_file.seek(0)
+        with timer.span("stream_describe"):
+            for chunk in iter_chunks(uploaded_file, file_format(uploaded_file.name)):
+                summary.update(chunk)
+                stream_progress.caption(tt["stream_rows"].format(summary.rows))
+                stream_table.dataframe(summary.describe())
+        st.markdown("</div>", unsafe_allow_html=True)
+        st.info(tt["stream_note"])
+    elif uploaded_file:
+        with timer.span("read_excel"):
+            dataset_id, df = parse_cache.load(uploaded_file.getvalue(), fmt=file_format(uploaded_file.name))
+        engine = AnalysisEngine(df, dataset_id, get_result_cache())
+        # Profil kolom (jenis, null, kardinalitas, kode kategori) dibangun sekali per dataset
+        with timer.span("column_profile"):
+            profiles = engine.profiles()
+
+        def likert_tag(col):
+            return f" ({tt['type_likert']})" if profiles[col].likert else ""
+
+        # Desain survei: bobot dan stratum (opsional) dipakai statistik deskriptif, crosstab dan korelasi
+        with st.sidebar:
+            st.markdown(f"**{tt['design_title']}**")
+            weight_choice = st.selectbox(tt["weight_col"], [tt["none_option"]] + engine.columns_of_kind(KIND_NUMERIC),
+                                         key="design_weight")
+            strata_choice = st.selectbox(tt["strata_col"], [tt["none_option"]] + df.columns.tolist(),
+                                         key="design_strata")
+        weight_col = None if weight_choice == tt["none_option"] else weight_choice
+        strata_col = None if strata_choice == tt["none_option"] else strata_choice
+        weighted = weight_col is not None or strata_col is not None
+
         st.subheader(tt["preview"])
         st.markdown("<div class='stCard'>", unsafe_allow_html=True)
-        st.dataframe(df)
+        # Preview per halaman: hanya baris yang terlihat yang dikirim ke browser
+        all_cols = df.columns.tolist()
+        none_opt = [tt["none_option"]]
+        colP1, colP2, colP3 = st.columns(3)
+        with colP1:
+            sort_by = st.selectbox(tt["sort_by"], none_opt + all_cols, key="preview_sort")
+            sort_desc = st.checkbox(tt["sort_desc"], key="preview_desc")
+        with colP2:
+            filter_col = st.selectbox(tt["filter_col"], none_opt + all_cols, key="preview_filter_col")
+            filter_text = st.text_input(tt["filter_text"], key="preview_filter_text")
+        with colP3:
+            page_size = st.selectbox(tt["page_size"], PAGE_SIZES, key="preview_page_size")
+            preview_cols = st.multiselect(tt["preview_cols"], all_cols, key="preview_cols")
+        pager = get_preview_pager()
+        preview_filter = dict(
+            sort_by=None if sort_by == tt["none_option"] else sort_by,
+            ascending=not sort_desc,
+            filter_col=None if filter_col == tt["none_option"] else filter_col,
+            filter_text=filter_text,
+        )
+        with timer.span("preview_page"):
+            total_rows = len(pager.positions(dataset_id, df, **preview_filter))
+        page_no = st.number_input(tt["page"], min_value=1, max_value=page_count(total_rows, page_size),
+                                  value=1, step=1, key="preview_page")
+        page_start = (page_no - 1) * page_size
+        with timer.span("preview_page"):
+            page_df, total_rows = pager.page(dataset_id, df, page_start, page_size, preview_cols, **preview_filter)
+        st.caption(tt["page_info"].format(*page_label_range(page_start, page_size, total_rows), total_rows))
+        with timer.span("st.dataframe"):
+            st.dataframe(page_df)
         st.markdown("</div>", unsafe_allow_html=True)
 
         # --- Distribusi Data ---
         st.markdown(f"<div class='stSubHeader'>{tt['desc_title']}</div>", unsafe_allow_html=True)
         st.markdown("<div class='stCard'>", unsafe_allow_html=True)
-        numeric_cols = df.select_dtypes(include=np.number).columns.tolist()
+        numeric_cols = engine.columns_of_kind(KIND_NUMERIC)
         selected_desc_cols = st.multiselect(tt["desc_cols"], numeric_cols)
         if selected_desc_cols:
-            desc = df[selected_desc_cols].describe().T
-            desc["skew"] = df[selected_desc_cols].skew()
-            desc["kurtosis"] = df[selected_desc_cols].kurtosis()
-            st.dataframe(desc)
-            for col in selected_desc_cols:
-                st.markdown(f"<span class='stLabel'>{tt['hist']}: {col}</span>", unsafe_allow_html=True)
-                fig1, ax1 = plt.subplots(figsize=(7,3))
-                ax1.hist(df[col].dropna(), bins=20, color="#1976d2", alpha=0.86)
-                ax1.set_facecolor("#223a5e")
-                ax1.set_title(f"{tt['hist']}: {col}", fontsize=13, fontweight="bold")
-                st.pyplot(fig1)
-                st.markdown(f"<span class='stLabel'>{tt['box']}: {col}</span>", unsafe_allow_html=True)
-                fig2, ax2 = plt.subplots(figsize=(7,3))
-                ax2.boxplot(df[col].dropna(), vert=False, patch_artist=True,
-                            boxprops=dict(facecolor='#f7c325', color='#1976d2'))
-                ax2.set_facecolor("#223a5e")
-                ax2.set_title(f"{tt['box']}: {col}", fontsize=13, fontweight="bold")
-                st.pyplot(fig2)
+            with timer.span("describe"):
+                if weighted:
+                    desc = engine.describe_weighted(selected_desc_cols, weight_col, strata_col)
+                else:
+                    desc = engine.describe(selected_desc_cols)
+            if weighted:
+                st.caption(tt["weighted_note"])
+            with timer.span("st.dataframe"):
+                st.dataframe(desc)
+            charts = get_chart_renderer()
+            if st.checkbox(tt["small_multiples"], key="small_multiples"):
+                with timer.span("charts"):
+                    png = charts.small_multiples(dataset_id, df, selected_desc_cols, tt["hist"], tt["box"])
+                    if png is not None:
+                        st.image(png)
+            else:
+                with timer.span("charts"):
+                    for col in selected_desc_cols:
+                        hist_png = charts.histogram(dataset_id, df, col, f"{tt['hist']}: {col}")
+                        box_png = charts.boxplot(dataset_id, df, col, f"{tt['box']}: {col}")
+                        if hist_png is None:
+                            continue
+                        st.markdown(f"<span class='stLabel'>{tt['hist']}: {col}</span>", unsafe_allow_html=True)
+                        st.image(hist_png)
+                        st.markdown(f"<span class='stLabel'>{tt['box']}: {col}</span>", unsafe_allow_html=True)
+                        st.image(box_png)
         else:
             st.info(tt["desc_cols"])
         st.markdown("</div>", unsafe_allow_html=True)
 
         # --- Analisis Hubungan Variabel ---
+        # Satu komponen: setiap (x1, x2, metode) dihitung sekali lewat engine lalu dipakai semua panel
         st.markdown(f"<div class='stSubHeader'>{tt['vra_title']}</div>", unsafe_allow_html=True)
         st.markdown("<div class='stCard'>", unsafe_allow_html=True)
         colX1, colX2 = st.columns(2)
         with colX1:
-            x1 = st.selectbox(tt["vra_var1"], df.columns.tolist())
+            x1 = st.selectbox(tt["vra_var1"], df.columns.tolist(), key="var1_selectbox")
         with colX2:
-            x2 = st.selectbox(tt["vra_var2"], df.columns.tolist(), index=1 if len(df.columns)>1 else 0)
-        tipe_x1 = tt["type_num"] if np.issubdtype(df[x1].dropna().dtype, np.number) else tt["type_cat"]
-        tipe_x2 = tt["type_num"] if np.issubdtype(df[x2].dropna().dtype, np.number) else tt["type_cat"]
-        st.markdown(f"<span class='stLabel'>{x1} → {tipe_x1}</span>", unsafe_allow_html=True)
-        st.markdown(f"<span class='stLabel'>{x2} → {tipe_x2}</span>", unsafe_allow_html=True)
+            x2 = st.selectbox(tt["vra_var2"], df.columns.tolist(), index=1 if len(df.columns)>1 else 0,
+                              key="var2_selectbox")
+        tipe_x1 = tt["type_num"] if engine.kind(x1) == KIND_NUMERIC else tt["type_cat"]
+        tipe_x2 = tt["type_num"] if engine.kind(x2) == KIND_NUMERIC else tt["type_cat"]
+        st.markdown(f"<span class='stLabel'>{x1} → {tipe_x1}{likert_tag(x1)}</span>", unsafe_allow_html=True)
+        st.markdown(f"<span class='stLabel'>{x2} → {tipe_x2}{likert_tag(x2)}</span>", unsafe_allow_html=True)
 
+        # --- Kategori x Kategori ---
         if tipe_x1 == tt["type_cat"] and tipe_x2 == tt["type_cat"]:
             st.info(tt["cat_info"])
-            cont_table = pd.crosstab(df[x1], df[x2])
+            with timer.span("crosstab_chi2"):
+                if weighted:
+                    chi_result = engine.crosstab_weighted(x1, x2, weight_col, strata_col)
+                else:
+                    # Seed tetap: p-value permutasi tabel jarang sama di setiap rerun dan di batch.py
+                    with st.spinner(tt["chi2_running"]):
+                        chi_result = engine.crosstab_chi2(x1, x2, seed=0)
+            cont_table = chi_result["table"]
             st.subheader(tt["result_cat_cat"])
             st.markdown("<div class='st-df'>", unsafe_allow_html=True)
             st.dataframe(cont_table)
             st.markdown("</div>", unsafe_allow_html=True)
-            chi2, p, dof, expected = chi2_contingency(cont_table)
+            chi2, p, dof = chi_result["chi2"], chi_result["p"], chi_result["dof"]
+            with st.expander(tt["expected_title"]):
+                st.dataframe(chi_result["expected"])
             st.write(tt["chi2"].format(chi2))
             st.write(tt["pval"].format(p))
             st.write(tt["dof"].format(dof))
+            st.write(tt["cramers_v"].format(chi_result["cramers_v"]))
+            if chi_result["test"] == TEST_FISHER:
+                st.info(tt["sparse_fisher"].format(chi_result["p_asymptotic"]))
+            elif chi_result["test"] == TEST_PERMUTATION:
+                st.info(tt["sparse_perm"].format(chi_result["permutations"], chi_result["p_asymptotic"]))
+            elif chi_result["test"] == TEST_RAO_SCOTT:
+                st.info(tt["rao_scott"].format(chi_result["deff"]))
+            elif chi_result["sparse"]:
+                st.info(tt["sparse_asymptotic"])
             st.markdown(tt["conclusion"])
-            if p < 0.05:
-                st.success(tt["conclude_sig"])
+            p_adj = adjust_pvalues([p], correction)[0]
+            if significant(p_adj, alpha):
+                st.success(tt["conclude_sig"].format(alpha=alpha))
             else:
-                st.warning(tt["conclude_nosig"])
-
-# --- Analisis Hubungan Variabel ---
-if uploaded_file:
-    # Pilih variabel
-    colX1, colX2 = st.columns(2)
-    with colX1:
-        x1 = st.selectbox(tt["vra_var1"], df.columns.tolist(), key="var1_selectbox")
-    with colX2:
-        x2 = st.selectbox(tt["vra_var2"], df.columns.tolist(), key="var2_selectbox")
-
-
-    tipe_x1 = tt["type_num"] if np.issubdtype(df[x1].dropna().dtype, np.number) else tt["type_cat"]
-    tipe_x2 = tt["type_num"] if np.issubdtype(df[x2].dropna().dtype, np.number) else tt["type_cat"]
-
-    st.markdown(f"<span class='stLabel'>{x1} → {tipe_x1}</span>", unsafe_allow_html=True)
-    st.markdown(f"<span class='stLabel'>{x2} → {tipe_x2}</span>", unsafe_allow_html=True)
-
-    # --- Kategori x Kategori ---
-    if tipe_x1 == tt["type_cat"] and tipe_x2 == tt["type_cat"]:
-        st.info(tt["cat_info"])
-        cont_table = pd.crosstab(df[x1], df[x2])
-        st.subheader(tt["result_cat_cat"])
-        st.markdown("<div class='st-df'>", unsafe_allow_html=True)
-        st.dataframe(cont_table)
-        st.markdown("</div>", unsafe_allow_html=True)
-        chi2, p, dof, expected = chi2_contingency(cont_table)
-        st.write(tt["chi2"].format(chi2))
-        st.write(tt["pval"].format(p))
-        st.write(tt["dof"].format(dof))
-        st.markdown(tt["conclusion"])
-        if p < 0.05:
-            st.success(tt["conclude_sig"])
-        else:
-            st.warning(tt["conclude_nosig"])
-
-    # --- Numerik x Numerik ---
-    elif tipe_x1 == tt["type_num"] and tipe_x2 == tt["type_num"]:
-        st.info(tt["num_info"])
-        method_options = [tt["pearson"], tt["spearman"]]
-        corr_method = st.selectbox(tt["corr_method_label"], method_options, key="corr_method")
-
-        mask = df[[x1, x2]].dropna()
-        data_x1 = mask[x1]
-        data_x2 = mask[x2]
-
-        # Hitung korelasi
-        if corr_method == tt["pearson"]:
-            coef, p = pearsonr(data_x1, data_x2)
-            method_name = tt["pearson"]
-        else:
-            coef, p = spearmanr(data_x1, data_x2)
-            method_name = tt["spearman"]
-
-        # Tampilkan hasil
-        st.subheader(f"{tt['result_num_num']} ({method_name})")
-        st.markdown("<div class='st-df'>", unsafe_allow_html=True)
-        st.write(tt["corr_coef"].format(coef))
-        st.write(tt["corr_pval"].format(p))
-        st.markdown("</div>", unsafe_allow_html=True)
+                st.warning(tt["conclude_nosig"].format(alpha=alpha))
 
-        # Kesimpulan signifikan / tidak
-        st.markdown(tt["conclusion"])
-        if p < 0.05:
-            st.success(tt["corr_conclude_sig"])
-        else:
-            st.warning(tt["corr_conclude_nosig"])
+        # --- Numerik x Numerik ---
+        elif tipe_x1 == tt["type_num"] and tipe_x2 == tt["type_num"]:
+            st.info(tt["num_info"])
+            method_options = [tt["pearson"], tt["spearman"]]
+            corr_method = st.selectbox(tt["corr_method_label"], method_options, key="corr_method")
 
-        # Tambahan: tampilkan metode yang digunakan
-        st.info(f"Metode korelasi yang digunakan: **{method_name}**")
+            # Hitung korelasi
+            if corr_method == tt["pearson"]:
+                method_key, method_name = METHOD_PEARSON, tt["pearson"]
+            else:
+                method_key, method_name = METHOD_SPEARMAN, tt["spearman"]
+            with timer.span("correlation"):
+                if weighted:
+                    corr_result = engine.correlation_weighted(x1, x2, method_key, weight_col, strata_col)
+                else:
+                    corr_result = engine.correlation(x1, x2, method_key)
+            coef, p = corr_result["coef"], corr_result["p"]
 
-    # --- Campuran / kombinasi belum didukung ---
-    else:
-        st.warning(tt["mix_info"])
-        st.markdow
+            # Tampilkan hasil
+            st.subheader(f"{tt['result_num_num']} ({method_name})")
+            st.markdown("<div class='st-df'>", unsafe_allow_html=True)
+            st.write(tt["corr_coef"].format(coef))
+            st.write(tt["corr_pval"].format(p))
+            if weighted:
+                st.write(tt["design_se"].format(corr_result["se"]))
+            st.markdown("</div>", unsafe_allow_html=True)
 
+            # Bootstrap CI dan p-value permutasi (opsional, lebih berat; hanya untuk data tak berbobot)
+            if not weighted and st.checkbox(tt["resample_label"], key="corr_resample"):
+                n_resamples = st.selectbox(tt["resample_count"], RESAMPLE_COUNTS, index=1, key="corr_resample_n")
+                with st.spinner(tt["resample_running"]), timer.span("resampling"):
+                    resampled = engine.correlation_resampling(x1, x2, method_key, n_resamples, seed=0)
+                st.write(tt["boot_ci"].format(resampled["confidence"], resampled["ci_low"], resampled["ci_high"]))
+                st.write(tt["boot_se"].format(resampled["std_error"]))
+                st.write(tt["perm_pval"].format(resampled["p_permutation"], resampled["n_permutations"]))
+                p = resampled["p_permutation"]
 
+            # Kesimpulan signifikan / tidak
+            st.markdown(tt["conclusion"])
+            p_adj = adjust_pvalues([p], correction)[0]
+            if significant(p_adj, alpha):
+                st.success(tt["corr_conclude_sig"].format(alpha=alpha))
+            else:
+                st.warning(tt["corr_conclude_nosig"].format(alpha=alpha))
+
+            # Tambahan: tampilkan metode yang digunakan
+            st.info(f"Metode korelasi yang digunakan: **{method_name}**")
 
+        # --- Numerik x Kategori ---
+        else:
+            st.info(tt["mix_info"])
+            num_col, cat_col = (x1, x2) if tipe_x1 == tt["type_num"] else (x2, x1)
+            mix_method = st.selectbox(tt["mix_method_label"], [tt["anova"], tt["kruskal"]], key="mix_method")
+            with timer.span("group_comparison"):
+                mix_result = engine.group_comparison(num_col, cat_col)
+            if weighted:
+                st.caption(tt["unweighted_note"])
+
+            st.subheader(f"{tt['result_mix']} ({mix_method})")
+            st.markdown("<div class='st-df'>", unsafe_allow_html=True)
+            st.dataframe(mix_result["groups"])
+            st.markdown("</div>", unsafe_allow_html=True)
+            if mix_method == tt["anova"]:
+                st.write(tt["f_stat"].format(mix_result["f"]))
+                p = mix_result["f_p"]
+            else:
+                st.write(tt["h_stat"].format(mix_result["h"]))
+                p = mix_result["h_p"]
+            st.write(tt["pval"].format(p))
+            st.write(tt["eta_sq"].format(mix_result["eta_sq"]))
+            if mix_result["k"] == 2:
+                st.write(tt["pb_corr"].format(mix_result["point_biserial"], mix_result["point_biserial_p"]))
+
+            st.markdown(tt["conclusion"])
+            p_adj = adjust_pvalues([p], correction)[0]
+            if significant(p_adj, alpha):
+                st.success(tt["conclude_sig"].format(alpha=alpha))
+            else:
+                st.warning(tt["conclude_nosig"].format(alpha=alpha))
+        st.markdown("</div>", unsafe_allow_html=True)
+
+        # --- Matriks Asosiasi (semua pasangan) ---
+        st.markdown(f"<div class='stSubHeader'>{tt['matrix_title']}</div>", unsafe_allow_html=True)
+        st.markdown("<div class='stCard'>", unsafe_allow_html=True)
+        if st.checkbox(tt["matrix_enable"], key="matrix_enable"):
+            # Figure tanpa pyplot, seperti di charts.py
+            from matplotlib.figure import Figure
+
+            if weighted:
+                st.caption(tt["unweighted_note"])
+            # Bawaan tanpa kolom ID/teks bebas: tabel silangnya terlalu besar dan tidak bermakna
+            matrix_default = matrix_default_columns(engine.profiles())
+            matrix_cols = st.multiselect(tt["matrix_cols"], df.columns.tolist(), key="matrix_cols") or matrix_default
+            matrix_excluded = [str(c) for c in df.columns if c not in matrix_default]
+            if matrix_excluded and matrix_cols is matrix_default:
+                st.caption(tt["matrix_excluded"].format(MATRIX_DEFAULT_MAX_LEVELS, ", ".join(matrix_excluded)))
+            matrix_num = [c for c in matrix_cols if engine.kind(c) == KIND_NUMERIC]
+            matrix_cat = [c for c in matrix_cols if engine.kind(c) != KIND_NUMERIC]
+            if len(matrix_num) < 2 and len(matrix_cat) < 2:
+                st.info(tt["matrix_none"])
+            if len(matrix_num) >= 2:
+                matrix_method_label = st.selectbox(
+                    tt["corr_method_label"], [tt["pearson"], tt["spearman"]], key="matrix_method")
+                matrix_method = METHOD_PEARSON if matrix_method_label == tt["pearson"] else METHOD_SPEARMAN
+                with timer.span("correlation_matrix"):
+                    corr_mat = engine.correlation_matrix(matrix_num, matrix_method)
+                st.subheader(f"{tt['matrix_num']} ({matrix_method_label})")
+                fig = Figure(figsize=(7, 6))
+                ax = fig.subplots()
+                im = ax.imshow(corr_mat["coef"].to_numpy(), cmap="coolwarm", vmin=-1, vmax=1)
+                if len(matrix_num) <= 40:
+                    ax.set_xticks(range(len(matrix_num)), matrix_num, rotation=90, fontsize=8)
+                    ax.set_yticks(range(len(matrix_num)), matrix_num, fontsize=8)
+                fig.colorbar(im, ax=ax)
+                st.pyplot(fig)
+                corr_pairs = add_adjusted(matrix_pairs(corr_mat, "coef", "coef"), correction, alpha)
+                st.caption(tt["matrix_sig"].format(int(corr_pairs["significant"].sum()), len(corr_pairs)))
+                st.dataframe(corr_pairs.sort_values("p_adj"), hide_index=True)
+            if len(matrix_cat) >= 2:
+                with timer.span("chi_square_matrix"):
+                    chi_mat = engine.chi_square_matrix(matrix_cat)
+                st.subheader(tt["matrix_cat"])
+                fig = Figure(figsize=(7, 6))
+                ax = fig.subplots()
+                im = ax.imshow(chi_mat["cramers_v"].to_numpy(), cmap="viridis", vmin=0, vmax=1)
+                if len(matrix_cat) <= 40:
+                    ax.set_xticks(range(len(matrix_cat)), matrix_cat, rotation=90, fontsize=8)
+                    ax.set_yticks(range(len(matrix_cat)), matrix_cat, fontsize=8)
+                fig.colorbar(im, ax=ax)
+                st.pyplot(fig)
+                matrix_skipped = int(chi_mat["skipped"].to_numpy().sum()) // 2
+                if matrix_skipped:
+                    st.warning(tt["matrix_skipped"].format(matrix_skipped, MATRIX_MAX_CELLS))
+                chi_pairs = add_adjusted(matrix_pairs(chi_mat, "chi2", "cramers_v"), correction, alpha)
+                st.caption(tt["matrix_sig"].format(int(chi_pairs["significant"].sum()), len(chi_pairs)))
+                st.dataframe(chi_pairs.sort_values("p_adj"), hide_index=True)
+        st.markdown("</div>", unsafe_allow_html=True)
 
+# --- Panel waktu per tahap (rerun ini) dan log JSON-lines opsional ---
+timer.finish()
+if show_timing:
+    with st.sidebar:
+        import pandas as pd
 
+        st.markdown(f"**{tt['timing_title']}**")
+        timing_df = pd.DataFrame(timer.records, columns=["stage", "seconds", "peak_mb", "depth"])
+        timing_df["stage"] = ["  " * d + name for name, d in zip(timing_df["stage"], timing_df["depth"])]
+        st.dataframe(timing_df.drop(columns="depth"), hide_index=True)
+        st.caption(tt["timing_total"].format(timer.elapsed))
+timer.write_jsonl(menu=menu, session=st.session_state.setdefault("timing_session", uuid.uuid4().hex))
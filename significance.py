@@ -0,0 +1,60 @@
+"""Koreksi perbandingan berganda untuk banyak p-value sekaligus."""
+import numpy as np
+
+CORRECTION_NONE = "none"
+CORRECTION_BONFERRONI = "bonferroni"
+CORRECTION_HOLM = "holm"
+CORRECTION_BH = "fdr_bh"
+
+CORRECTIONS = (CORRECTION_NONE, CORRECTION_BONFERRONI, CORRECTION_HOLM, CORRECTION_BH)
+
+DEFAULT_ALPHA = 0.05
+
+
+def adjust_pvalues(p, method=CORRECTION_BH):
+    """P-value terkoreksi (vektor), bentuk sama dengan input; NaN dibiarkan.
+
+    ``bonferroni`` dan ``holm`` mengontrol FWER, ``fdr_bh`` (Benjamini-Hochberg)
+    mengontrol FDR. Hasilnya sama dengan ``statsmodels.multipletests``.
+    """
+    p = np.asarray(p, dtype=float)
+    out = np.full(p.shape, np.nan)
+    flat = p.ravel()
+    valid = ~np.isnan(flat)
+    values = flat[valid]
+    m = len(values)
+    if m == 0:
+        return out
+    if method == CORRECTION_NONE:
+        adjusted = values
+    elif method == CORRECTION_BONFERRONI:
+        adjusted = values * m
+    elif method == CORRECTION_HOLM:
+        order = np.argsort(values, kind="stable")
+        steps = (m - np.arange(m)) * values[order]
+        adjusted = np.empty(m)
+        adjusted[order] = np.maximum.accumulate(steps)
+    elif method == CORRECTION_BH:
+        order = np.argsort(values, kind="stable")[::-1]
+        steps = values[order] * m / (m - np.arange(m))
+        adjusted = np.empty(m)
+        adjusted[order] = np.minimum.accumulate(steps)
+    else:
+        raise ValueError(f"Metode koreksi tidak dikenal: {method!r}")
+    out_flat = out.ravel()
+    out_flat[valid] = np.minimum(adjusted, 1.0)
+    return out_flat.reshape(p.shape)
+
+
+def significant(p_adjusted, alpha=DEFAULT_ALPHA):
+    """Masker signifikan (``p_adj < alpha``); NaN dianggap tidak signifikan."""
+    p_adjusted = np.asarray(p_adjusted, dtype=float)
+    return np.nan_to_num(p_adjusted, nan=1.0) < alpha
+
+
+def add_adjusted(table, method=CORRECTION_BH, alpha=DEFAULT_ALPHA, p_column="p"):
+    """Salinan tabel pasangan dengan kolom ``p_adj`` dan ``significant``."""
+    table = table.copy()
+    table["p_adj"] = adjust_pvalues(table[p_column].to_numpy(), method)
+    table["significant"] = significant(table["p_adj"].to_numpy(), alpha)
+    return table
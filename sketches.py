@@ -0,0 +1,277 @@
+"""Statistik satu-lintasan (streaming) yang bisa digabung antar potongan data.
+
+``RunningMoments`` menyimpan count, mean, M2, M3, M4, min dan max per kolom
+(rumus gabungan Chan/Pébay), ``CoMoments`` menyimpan ko-momen berpasangan
+untuk korelasi Pearson, ``QuantileSketch`` menyimpan ringkasan kuantil
+berukuran tetap. Keduanya tidak pernah memegang seluruh data sekaligus.
+"""
+import numpy as np
+import pandas as pd
+
+from ingest import KIND_OTHER, column_kind
+
+DESCRIBE_PERCENTILES = (0.25, 0.5, 0.75)
+
+
+class RunningMoments:
+    """Momen berjalan untuk ``k`` kolom sekaligus, diperbarui per potongan."""
+
+    def __init__(self, k):
+        self.n = np.zeros(k)
+        self.mean = np.zeros(k)
+        self.m2 = np.zeros(k)
+        self.m3 = np.zeros(k)
+        self.m4 = np.zeros(k)
+        self.min = np.full(k, np.inf)
+        self.max = np.full(k, -np.inf)
+
+    @classmethod
+    def from_array(cls, values):
+        """Momen dari satu matriks ``(baris, kolom)``; NaN diabaikan."""
+        values = np.asarray(values, dtype=float)
+        if values.ndim == 1:
+            values = values[:, None]
+        out = cls(values.shape[1])
+        valid = ~np.isnan(values)
+        n = valid.sum(axis=0).astype(float)
+        has = n > 0
+        total = np.where(valid, values, 0.0).sum(axis=0)
+        mean = np.divide(total, n, out=np.zeros_like(total), where=has)
+        dev = np.where(valid, values - mean, 0.0)
+        dev2 = dev * dev
+        out.n = n
+        out.mean = mean
+        out.m2 = dev2.sum(axis=0)
+        out.m3 = (dev2 * dev).sum(axis=0)
+        out.m4 = (dev2 * dev2).sum(axis=0)
+        out.min = np.where(has, np.where(valid, values, np.inf).min(axis=0, initial=np.inf), np.inf)
+        out.max = np.where(has, np.where(valid, values, -np.inf).max(axis=0, initial=-np.inf), -np.inf)
+        return out
+
+    def update(self, values):
+        self.merge(RunningMoments.from_array(values))
+        return self
+
+    def merge(self, other):
+        """Gabungkan momen ``other`` ke dalam objek ini (hasil sama dengan hitung ulang)."""
+        na, nb = self.n, other.n
+        n = na + nb
+        safe_n = np.where(n > 0, n, 1.0)
+        delta = other.mean - self.mean
+        delta_n = delta / safe_n
+        mean = self.mean + delta_n * nb
+        m2 = self.m2 + other.m2 + delta * delta_n * na * nb
+        m3 = (self.m3 + other.m3
+              + delta * delta_n ** 2 * na * nb * (na - nb)
+              + 3.0 * delta_n * (na * other.m2 - nb * self.m2))
+        m4 = (self.m4 + other.m4
+              + delta * delta_n ** 3 * na * nb * (na * na - na * nb + nb * nb)
+              + 6.0 * delta_n ** 2 * (na * na * other.m2 + nb * nb * self.m2)
+              + 4.0 * delta_n * (na * other.m3 - nb * self.m3))
+        self.n, self.mean, self.m2, self.m3, self.m4 = n, mean, m2, m3, m4
+        self.min = np.minimum(self.min, other.min)
+        self.max = np.maximum(self.max, other.max)
+        return self
+
+    def std(self):
+        n = self.n
+        return np.sqrt(np.divide(self.m2, n - 1, out=np.full_like(n, np.nan), where=n > 1))
+
+    def skew(self):
+        """Skewness terkoreksi bias, sama dengan ``DataFrame.skew()``."""
+        n = self.n
+        with np.errstate(divide="ignore", invalid="ignore"):
+            m2 = self.m2 / n
+            g1 = (self.m3 / n) / m2 ** 1.5
+            out = np.sqrt(n * (n - 1)) / (n - 2) * g1
+        out = np.where(m2 <= 1e-14 * np.maximum(self.mean ** 2, 1.0), 0.0, out)
+        return np.where(n < 3, np.nan, out)
+
+    def kurtosis(self):
+        """Excess kurtosis terkoreksi bias, sama dengan ``DataFrame.kurtosis()``."""
+        n = self.n
+        with np.errstate(divide="ignore", invalid="ignore"):
+            m2 = self.m2 / n
+            g2 = (self.m4 / n) / m2 ** 2 - 3.0
+            out = ((n + 1) * g2 + 6.0) * (n - 1) / ((n - 2) * (n - 3))
+        out = np.where(m2 <= 1e-14 * np.maximum(self.mean ** 2, 1.0), 0.0, out)
+        return np.where(n < 4, np.nan, out)
+
+
+class CoMoments:
+    """Ko-momen berpasangan ``k x k`` (pairwise complete) untuk korelasi Pearson.
+
+    Untuk setiap pasangan ``(i, j)`` disimpan jumlah baris yang keduanya
+    terisi, rata-rata dan M2 kolom ``i`` pada baris tersebut, serta jumlah
+    perkalian simpangan ``C``. Penggabungan memakai rumus Chan per elemen,
+    jadi hasilnya sama dengan menghitung ulang seluruh data.
+    """
+
+    def __init__(self, k):
+        self.n = np.zeros((k, k))
+        self.mean = np.zeros((k, k))
+        self.m2 = np.zeros((k, k))
+        self.c = np.zeros((k, k))
+
+    @classmethod
+    def from_array(cls, values):
+        """Ko-momen dari satu matriks ``(baris, kolom)``; NaN diabaikan per pasangan."""
+        values = np.asarray(values, dtype=float)
+        out = cls(values.shape[1])
+        present = ~np.isnan(values)
+        m = present.astype(float)
+        # Pusatkan per kolom agar perkalian matriks stabil secara numerik
+        with np.errstate(invalid="ignore"):
+            center = np.nan_to_num(np.nanmean(values, axis=0)) if len(values) else np.zeros(values.shape[1])
+        z = np.where(present, values - center, 0.0)
+        n = m.T @ m
+        sums = z.T @ m
+        safe_n = np.where(n > 0, n, 1.0)
+        out.n = n
+        out.mean = sums / safe_n + center[:, None]
+        out.m2 = (z * z).T @ m - sums * sums / safe_n
+        out.c = z.T @ z - sums * sums.T / safe_n
+        return out
+
+    def update(self, values):
+        self.merge(CoMoments.from_array(values))
+        return self
+
+    def merge(self, other):
+        na, nb = self.n, other.n
+        n = na + nb
+        safe_n = np.where(n > 0, n, 1.0)
+        delta = other.mean - self.mean
+        weight = na * nb / safe_n
+        self.mean = self.mean + delta * nb / safe_n
+        self.m2 = self.m2 + other.m2 + delta * delta * weight
+        self.c = self.c + other.c + delta * delta.T * weight
+        self.n = n
+        return self
+
+    def correlation(self):
+        """Matriks koefisien Pearson (NaN bila kurang dari 2 pasangan data)."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            coef = np.clip(self.c / np.sqrt(self.m2 * self.m2.T), -1.0, 1.0)
+        coef[self.n < 2] = np.nan
+        return coef
+
+
+class QuantileSketch:
+    """Ringkasan kuantil berukuran tetap (centroid berbobot, bisa digabung).
+
+    Selama jumlah data <= ``size`` hasilnya eksak (interpolasi linear seperti
+    pandas); setelah itu galat peringkat kira-kira ``1 / size``.
+    """
+
+    def __init__(self, size=1024):
+        self.size = size
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+
+    @property
+    def count(self):
+        return float(self.weights.sum())
+
+    def update(self, values, weights=None):
+        values = np.asarray(values, dtype=float)
+        keep = ~np.isnan(values)
+        if weights is None:
+            weights = np.ones(int(keep.sum()))
+        else:
+            weights = np.asarray(weights, dtype=float)[keep]
+        self._absorb(values[keep], weights)
+        return self
+
+    def merge(self, other):
+        self._absorb(other.means, other.weights)
+        return self
+
+    def _absorb(self, means, weights):
+        if len(means) == 0:
+            return
+        means = np.concatenate([self.means, means])
+        weights = np.concatenate([self.weights, weights])
+        order = np.argsort(means, kind="stable")
+        means, weights = means[order], weights[order]
+        if len(means) > self.size:
+            # Bagi ke bucket berbobot sama, lalu rata-rata berbobot per bucket
+            cum_before = np.cumsum(weights) - weights
+            bucket = np.minimum((cum_before / weights.sum() * self.size).astype(np.int64), self.size - 1)
+            bucket_weights = np.bincount(bucket, weights=weights, minlength=self.size)
+            bucket_sums = np.bincount(bucket, weights=weights * means, minlength=self.size)
+            used = bucket_weights > 0
+            weights = bucket_weights[used]
+            means = bucket_sums[used] / weights
+        self.means, self.weights = means, weights
+
+    def quantile(self, q):
+        q = np.asarray(q, dtype=float)
+        if len(self.means) == 0:
+            return np.full(q.shape, np.nan)
+        centers = np.cumsum(self.weights) - self.weights / 2.0
+        target = q * (self.count - 1.0) + 0.5
+        return np.interp(target, centers, self.means)
+
+
+class StreamingSummary:
+    """Ringkasan deskriptif kolom numerik yang dibangun potongan demi potongan.
+
+    Kolom dianggap numerik selama semua nilai non-kosongnya bisa dibaca sebagai
+    angka; begitu muncul teks, kolom itu dikeluarkan dari ringkasan.
+    """
+
+    def __init__(self, sketch_size=1024):
+        self.sketch_size = sketch_size
+        self.columns = []
+        self.moments = None
+        self.sketches = []
+        self.rejected = set()
+        self.rows = 0
+
+    def update(self, chunk):
+        if self.moments is None:
+            self.columns = list(chunk.columns)
+            self.moments = RunningMoments(len(self.columns))
+            self.sketches = [QuantileSketch(self.sketch_size) for _ in self.columns]
+        self.rows += len(chunk)
+        block = np.full((len(chunk), len(self.columns)), np.nan)
+        for j, name in enumerate(self.columns):
+            if name in self.rejected:
+                continue
+            raw = chunk.iloc[:, j]
+            # Bool dan tanggal/durasi bukan numerik, sama seperti jalur non-streaming
+            # (tanpa ini pd.to_numeric mengubah datetime64 menjadi nanodetik)
+            if pd.api.types.is_bool_dtype(raw.dtype) or column_kind(raw) == KIND_OTHER:
+                self.rejected.add(name)
+                continue
+            values = pd.to_numeric(raw, errors="coerce")
+            if values.notna().sum() != raw.notna().sum():
+                self.rejected.add(name)
+                continue
+            block[:, j] = values.to_numpy(dtype=float)
+            self.sketches[j].update(block[:, j])
+        self.moments.merge(RunningMoments.from_array(block))
+        return self
+
+    def numeric_columns(self):
+        return [c for c in self.columns if c not in self.rejected]
+
+    def describe(self):
+        """Tabel seperti ``df.describe().T`` ditambah kolom skew dan kurtosis."""
+        m = self.moments
+        if m is None:
+            return pd.DataFrame()
+        std, skew, kurt = m.std(), m.skew(), m.kurtosis()
+        rows, index = [], []
+        for j, name in enumerate(self.columns):
+            if name in self.rejected or m.n[j] == 0:
+                continue
+            q25, q50, q75 = self.sketches[j].quantile(DESCRIBE_PERCENTILES)
+            index.append(name)
+            rows.append({
+                "count": m.n[j], "mean": m.mean[j], "std": std[j], "min": m.min[j],
+                "25%": q25, "50%": q50, "75%": q75, "max": m.max[j],
+                "skew": skew[j], "kurtosis": kurt[j],
+            })
+        return pd.DataFrame(rows, index=index)
@@ -0,0 +1,19 @@
+"""Pemeriksaan regresi untuk kasus tepi analisis (jalankan dengan ``python -m pytest``)."""
+import numpy as np
+import pandas as pd
+
+from analysis import group_comparison
+
+
+def test_group_comparison_constant_column():
+    df = pd.DataFrame({"x": [3.0] * 9, "g": list("abcabcabc")})
+    result = group_comparison(df, "x", "g")
+    assert np.isnan(result["f"]) and np.isnan(result["f_p"])
+    assert np.isnan(result["eta_sq"])
+
+
+def test_group_comparison_perfectly_separated_groups():
+    df = pd.DataFrame({"x": [1.0] * 5 + [2.0] * 5, "g": list("aaaaabbbbb")})
+    result = group_comparison(df, "x", "g")
+    assert result["f"] == np.inf and result["f_p"] == 0.0
+    assert result["eta_sq"] == 1.0
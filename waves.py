@@ -0,0 +1,258 @@
+"""Mode tambah gelombang: statistik survei yang diperbarui per gelombang data.
+
+``WaveAccumulator`` hanya menyimpan statistik cukup yang bisa digabung:
+momen per kolom numerik, ringkasan kuantil, ko-momen berpasangan untuk
+Pearson, dan tabel kontingensi untuk setiap pasangan kolom kategorik.
+Menambah gelombang baru hanya memproses baris gelombang itu. Momen, korelasi
+Pearson dan tabel silang sama dengan hitung ulang seluruh data; kuantil
+berasal dari ``QuantileSketch`` (eksak sampai ``sketch_size`` nilai, setelah
+itu galat peringkat kira-kira ``1 / sketch_size``). Spearman dan uji
+permutasi membutuhkan data mentah, jadi tidak tersedia di mode ini.
+
+Jenis kolom ditetapkan dari gelombang pertama. Kolom yang hilang di
+gelombang berikutnya dianggap kosong, kolom baru diabaikan. Kolom kategorik
+yang melampaui ``max_levels`` kategori (ID, email, teks bebas) dikeluarkan
+dari tabel silang secara permanen, karena tabelnya tumbuh kuadratik.
+"""
+import io
+import json
+
+import numpy as np
+import pandas as pd
+
+from analysis import (MATRIX_DEFAULT_MAX_LEVELS, METHOD_PEARSON, contingency_counts, correlation_pvalues,
+                      crosstab_from_counts)
+from ingest import KIND_CATEGORICAL, KIND_NUMERIC, column_kind
+from sketches import DESCRIBE_PERCENTILES, CoMoments, QuantileSketch, RunningMoments
+
+STATE_VERSION = 1
+
+
+def _label_order(labels):
+    # Urutan label seperti kode kategori hitung ulang (terurut); campuran tipe tetap urutan masuk
+    try:
+        return np.argsort(np.asarray(labels, dtype=object), kind="stable")
+    except TypeError:
+        return np.arange(len(labels))
+
+
+def _plain(value):
+    return value.item() if isinstance(value, np.generic) else value
+
+
+class WaveAccumulator:
+    """Statistik cukup yang digabung gelombang demi gelombang."""
+
+    def __init__(self, sketch_size=1024, max_levels=MATRIX_DEFAULT_MAX_LEVELS):
+        self.sketch_size = sketch_size
+        self.max_levels = max_levels
+        self.numeric = []
+        self.categorical = []
+        self.high_cardinality = []
+        self.waves = []
+        self.rows = 0
+        self.moments = None
+        self.comoments = None
+        self.sketches = []
+        self.labels = {}
+        self._label_index = {}
+        self.tables = {}
+
+    def __contains__(self, wave_id):
+        return any(wave["id"] == wave_id for wave in self.waves)
+
+    # --- Menambah gelombang ---
+    def _setup(self, df):
+        for name in df.columns:
+            kind = column_kind(df[name])
+            if kind == KIND_NUMERIC:
+                self.numeric.append(name)
+            elif kind == KIND_CATEGORICAL:
+                self.categorical.append(name)
+        self.moments = RunningMoments(len(self.numeric))
+        self.comoments = CoMoments(len(self.numeric))
+        self.sketches = [QuantileSketch(self.sketch_size) for _ in self.numeric]
+        self.labels = {name: [] for name in self.categorical}
+        self._label_index = {name: {} for name in self.categorical}
+        self.tables = {(a, b): np.zeros((0, 0), dtype=np.int64)
+                       for i, a in enumerate(self.categorical) for b in self.categorical[i + 1:]}
+
+    def _encode(self, name, series):
+        # Kode global kategori; label baru ditambahkan di akhir
+        local, uniques = pd.factorize(series)
+        index, labels = self._label_index[name], self.labels[name]
+        mapping = np.empty(len(uniques), dtype=np.int32)
+        for code, label in enumerate(uniques):
+            label = _plain(label)
+            if label not in index:
+                index[label] = len(labels)
+                labels.append(label)
+            mapping[code] = index[label]
+        codes = np.full(len(local), -1, dtype=np.int32)
+        valid = local >= 0
+        codes[valid] = mapping[local[valid]]
+        return codes
+
+    def add(self, df, wave_id=None, name=None):
+        """Gabungkan satu gelombang; ``False`` bila ``wave_id`` sudah pernah ditambahkan."""
+        if wave_id is not None and wave_id in self:
+            return False
+        if self.moments is None:
+            self._setup(df)
+        rows = len(df)
+        block = np.full((rows, len(self.numeric)), np.nan)
+        for j, column in enumerate(self.numeric):
+            if column in df.columns:
+                block[:, j] = pd.to_numeric(df[column], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+            self.sketches[j].update(block[:, j])
+        self.moments.merge(RunningMoments.from_array(block))
+        self.comoments.merge(CoMoments.from_array(block))
+
+        codes = {column: (self._encode(column, df[column]) if column in df.columns
+                          else np.full(rows, -1, dtype=np.int32))
+                 for column in self.categorical}
+        for column in [c for c in self.categorical if len(self.labels[c]) > self.max_levels]:
+            self._drop_categorical(column)
+        for (a, b), table in self.tables.items():
+            k1, k2 = len(self.labels[a]), len(self.labels[b])
+            if table.shape != (k1, k2):
+                grown = np.zeros((k1, k2), dtype=np.int64)
+                grown[:table.shape[0], :table.shape[1]] = table
+                self.tables[a, b] = table = grown
+            table += contingency_counts(codes[a], codes[b], k1, k2)
+
+        self.rows += rows
+        self.waves.append({"id": wave_id, "name": name, "rows": rows})
+        return True
+
+    def _drop_categorical(self, column):
+        self.categorical.remove(column)
+        self.high_cardinality.append(column)
+        del self.labels[column], self._label_index[column]
+        self.tables = {pair: table for pair, table in self.tables.items() if column not in pair}
+
+    # --- Hasil ---
+    def wave_table(self):
+        return pd.DataFrame(self.waves, columns=["name", "rows"])
+
+    def describe(self, columns=None):
+        """Tabel seperti ``describe_columns``: describe, skew dan kurtosis kolom numerik."""
+        columns = list(columns) if columns is not None else list(self.numeric)
+        if self.moments is None or not columns:
+            return pd.DataFrame()
+        idx = [self.numeric.index(c) for c in columns]
+        m = self.moments
+        std, skew, kurt = m.std()[idx], m.skew()[idx], m.kurtosis()[idx]
+        quantiles = np.array([self.sketches[j].quantile(DESCRIBE_PERCENTILES) for j in idx]).reshape(-1, 3)
+        has = m.n[idx] > 0
+        return pd.DataFrame({
+            "count": m.n[idx],
+            "mean": np.where(has, m.mean[idx], np.nan),
+            "std": std,
+            "min": np.where(has, m.min[idx], np.nan),
+            "25%": quantiles[:, 0],
+            "50%": quantiles[:, 1],
+            "75%": quantiles[:, 2],
+            "max": np.where(has, m.max[idx], np.nan),
+            "skew": skew,
+            "kurtosis": kurt,
+        }, index=pd.Index(columns))
+
+    def correlation_matrix(self, columns=None):
+        """Sama dengan ``analysis.correlation_matrix(..., METHOD_PEARSON)`` atas semua gelombang."""
+        columns = list(columns) if columns is not None else list(self.numeric)
+        idx = np.array([self.numeric.index(c) for c in columns], dtype=np.int64)
+        coef = self.comoments.correlation()[np.ix_(idx, idx)]
+        n = self.comoments.n[np.ix_(idx, idx)]
+        frame = lambda a: pd.DataFrame(a, index=columns, columns=columns)  # noqa: E731
+        return {"method": METHOD_PEARSON, "coef": frame(coef), "p": frame(correlation_pvalues(coef, n)),
+                "n": frame(n.astype(np.int64))}
+
+    def correlation(self, x1, x2):
+        matrix = self.correlation_matrix([x1, x2])
+        return {
+            "method": METHOD_PEARSON,
+            "coef": float(matrix["coef"].iat[0, 1]),
+            "p": float(matrix["p"].iat[0, 1]),
+            "n": int(matrix["n"].iat[0, 1]),
+        }
+
+    def counts(self, x1, x2):
+        """Tabel kontingensi (baris = ``x1``) atas semua gelombang, label terurut."""
+        if (x1, x2) in self.tables:
+            table = self.tables[x1, x2]
+        else:
+            table = self.tables[x2, x1].T
+        labels1 = np.asarray(self.labels[x1], dtype=object)
+        labels2 = np.asarray(self.labels[x2], dtype=object)
+        order1, order2 = _label_order(labels1), _label_order(labels2)
+        return table[np.ix_(order1, order2)], labels1[order1], labels2[order2]
+
+    def crosstab_chi2(self, x1, x2):
+        """Seperti ``analysis.crosstab_chi2``; tabel jarang hanya bisa diuji eksak bila 2x2."""
+        counts, labels1, labels2 = self.counts(x1, x2)
+        return crosstab_from_counts(counts, labels1, labels2, x1, x2)
+
+    # --- Simpan / buka kembali ---
+    def to_bytes(self):
+        """Seluruh state sebagai file ``.npz`` (tanpa pickle)."""
+        meta = {
+            "version": STATE_VERSION,
+            "sketch_size": self.sketch_size,
+            "max_levels": self.max_levels,
+            "numeric": self.numeric,
+            "categorical": self.categorical,
+            "high_cardinality": self.high_cardinality,
+            "labels": [self.labels[c] for c in self.categorical],
+            "pairs": [list(pair) for pair in self.tables],
+            "waves": self.waves,
+            "rows": self.rows,
+        }
+        arrays = {"meta": np.array(json.dumps(meta, ensure_ascii=False, default=str))}
+        if self.moments is not None:
+            for field in ("n", "mean", "m2", "m3", "m4", "min", "max"):
+                arrays[f"moments_{field}"] = getattr(self.moments, field)
+            for field in ("n", "mean", "m2", "c"):
+                arrays[f"comoments_{field}"] = getattr(self.comoments, field)
+            arrays["sketch_sizes"] = np.array([len(s.means) for s in self.sketches], dtype=np.int64)
+            arrays["sketch_means"] = np.concatenate([s.means for s in self.sketches] + [np.empty(0)])
+            arrays["sketch_weights"] = np.concatenate([s.weights for s in self.sketches] + [np.empty(0)])
+            tables = list(self.tables.values())
+            arrays["table_shapes"] = np.array([t.shape for t in tables], dtype=np.int64).reshape(-1, 2)
+            arrays["table_counts"] = np.concatenate([t.ravel() for t in tables] + [np.empty(0, np.int64)])
+        buffer = io.BytesIO()
+        np.savez_compressed(buffer, **arrays)
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data):
+        with np.load(io.BytesIO(data), allow_pickle=False) as npz:
+            meta = json.loads(str(npz["meta"]))
+            if meta.get("version") != STATE_VERSION:
+                raise ValueError(f"Versi state gelombang tidak didukung: {meta.get('version')!r}")
+            out = cls(meta["sketch_size"], meta.get("max_levels", MATRIX_DEFAULT_MAX_LEVELS))
+            out.numeric, out.categorical = meta["numeric"], meta["categorical"]
+            out.high_cardinality = meta.get("high_cardinality", [])
+            out.waves, out.rows = meta["waves"], meta["rows"]
+            out.labels = dict(zip(out.categorical, meta["labels"]))
+            out._label_index = {c: {label: i for i, label in enumerate(labels)} for c, labels in out.labels.items()}
+            if "moments_n" not in npz:
+                return out
+            out.moments = RunningMoments(len(out.numeric))
+            for field in ("n", "mean", "m2", "m3", "m4", "min", "max"):
+                setattr(out.moments, field, npz[f"moments_{field}"])
+            out.comoments = CoMoments(len(out.numeric))
+            for field in ("n", "mean", "m2", "c"):
+                setattr(out.comoments, field, npz[f"comoments_{field}"])
+            bounds = np.cumsum(np.concatenate([[0], npz["sketch_sizes"]]))
+            means, weights = npz["sketch_means"], npz["sketch_weights"]
+            for start, stop in zip(bounds[:-1], bounds[1:]):
+                sketch = QuantileSketch(out.sketch_size)
+                sketch.means, sketch.weights = means[start:stop], weights[start:stop]
+                out.sketches.append(sketch)
+            offset = 0
+            flat = npz["table_counts"].astype(np.int64)
+            for (a, b), (k1, k2) in zip(meta["pairs"], npz["table_shapes"]):
+                out.tables[a, b] = flat[offset:offset + k1 * k2].reshape(k1, k2)
+                offset += k1 * k2
+        return out
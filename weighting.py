@@ -0,0 +1,297 @@
+"""Estimator survei berbobot dan berstrata.
+
+Bobot desain disimpan sebagai ``float32`` dan kode stratum sebagai ``int32``;
+baris tanpa bobot positif (atau tanpa stratum) tidak ikut dihitung. Momen,
+tabel silang dan korelasi berbobot dihitung dalam satu lintasan vektor atas
+array tersebut (akumulasi ``float64``; nilai data berpresisi ``float32``,
+sekitar 7 digit).
+
+Standard error berbasis desain memakai linearisasi Taylor dengan stratum dan
+setiap baris dianggap satu unit sampel (dengan pengembalian)::
+
+    Var = sum_h n_h / (n_h - 1) * sum_{i in h} (z_i - mean_h(z))^2
+
+dengan ``z_i`` variabel linearisasi estimator. Stratum yang hanya berisi satu
+baris tidak menyumbang varians. Uji independensi tabel silang memakai koreksi
+Rao-Scott orde pertama (Chi-Square dibagi rata-rata design effect).
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from analysis import METHOD_PEARSON, METHOD_SPEARMAN, coded_column
+
+TEST_RAO_SCOTT = "rao_scott"
+
+
+@dataclass(frozen=True)
+class SurveyDesign:
+    """Bobot dan stratum baris aktif, sudah diurutkan per stratum."""
+
+    rows: np.ndarray       # posisi baris aktif di DataFrame (int64, urut per stratum)
+    weights: np.ndarray    # bobot baris aktif (float32, > 0)
+    strata: np.ndarray     # kode stratum baris aktif (int32)
+    starts: np.ndarray     # awal tiap stratum yang berisi data di ``rows``
+    weight_column: object = None
+    strata_column: object = None
+
+    @property
+    def n(self):
+        return len(self.rows)
+
+    @property
+    def stratum_sizes(self):
+        return np.diff(np.append(self.starts, len(self.rows)))
+
+
+def survey_design(df, weight_column=None, strata_column=None, profiles=None):
+    """Bangun ``SurveyDesign`` dari kolom bobot dan kolom stratum (keduanya opsional)."""
+    if weight_column is not None:
+        weights = df[weight_column].to_numpy(dtype=np.float32, na_value=np.nan)
+        active = np.isfinite(weights) & (weights > 0)
+    else:
+        weights = np.ones(len(df), dtype=np.float32)
+        active = np.ones(len(df), dtype=bool)
+    if strata_column is not None:
+        strata, _ = coded_column(df, strata_column, profiles)
+        active &= strata >= 0
+    else:
+        strata = np.zeros(len(df), dtype=np.int32)
+    rows = np.flatnonzero(active)
+    rows = rows[np.argsort(strata[rows], kind="stable")]
+    sorted_strata = strata[rows].astype(np.int32)
+    starts = np.flatnonzero(np.r_[True, sorted_strata[1:] != sorted_strata[:-1]]) if len(rows) else rows
+    return SurveyDesign(rows, weights[rows], sorted_strata, starts, weight_column, strata_column)
+
+
+def _stratified_variance(s1, s2, n_h):
+    """Varians desain dari jumlah ``z`` dan ``z^2`` per stratum (baris = stratum)."""
+    n_h = n_h.reshape((-1,) + (1,) * (s1.ndim - 1)).astype(float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        per_stratum = n_h / (n_h - 1) * (s2 - s1 * s1 / n_h)
+    return np.where(n_h > 1, per_stratum, 0.0).sum(axis=0)
+
+
+def linearized_variance(z, design):
+    """Varians desain untuk total ``z`` (``(baris aktif, k)``, urut seperti ``design.rows``)."""
+    if len(z) == 0:
+        return np.full(z.shape[1:], np.nan)
+    s1 = np.add.reduceat(z, design.starts, axis=0)
+    s2 = np.add.reduceat(z * z, design.starts, axis=0)
+    return _stratified_variance(s1, s2, design.stratum_sizes)
+
+
+def proportion_variance(codes, k, design):
+    """Proporsi berbobot ``k`` kategori dan varians desainnya.
+
+    ``codes`` adalah kode baris aktif (``-1`` = di luar domain). Varians
+    dihitung dari jumlah ``w`` dan ``w^2`` per (stratum, kategori), tanpa
+    matriks indikator ``baris x kategori``.
+    """
+    w = design.weights.astype(np.float64)
+    inside = codes >= 0
+    total = w[inside].sum()
+    if total <= 0:
+        return np.full(k, np.nan), np.full(k, np.nan)
+    strata = design.strata.astype(np.int64)
+    n_strata = int(strata.max()) + 1
+    key = strata[inside] * k + codes[inside]
+    cell_w = np.bincount(key, weights=w[inside], minlength=n_strata * k).reshape(n_strata, k)
+    cell_w2 = np.bincount(key, weights=w[inside] ** 2, minlength=n_strata * k).reshape(n_strata, k)
+    dom_w = np.bincount(strata[inside], weights=w[inside], minlength=n_strata)[:, None]
+    dom_w2 = np.bincount(strata[inside], weights=w[inside] ** 2, minlength=n_strata)[:, None]
+    p = cell_w.sum(axis=0) / total
+    # z_i = w_i (I_ic - p_c) / total untuk baris di dalam domain, 0 di luar domain
+    s1 = (cell_w - p * dom_w) / total
+    s2 = (cell_w2 * (1.0 - 2.0 * p) + p * p * dom_w2) / total ** 2
+    n_h = np.bincount(strata, minlength=n_strata)
+    return p, _stratified_variance(s1, s2, n_h)
+
+
+def _weighted_quantiles(values, weights, qs):
+    # Interpolasi linear atas posisi kumulatif bobot; dengan bobot 1 sama dengan pandas
+    if len(values) == 0:
+        return np.full((len(qs), values.shape[1]), np.nan)
+    order = np.argsort(values, axis=0, kind="stable")  # NaN di akhir
+    x = np.take_along_axis(values, order, axis=0)
+    w = np.take_along_axis(weights, order, axis=0).astype(np.float64)
+    count = (~np.isnan(x)).sum(axis=0)
+    cum = np.cumsum(w, axis=0)
+    total = cum[-1]
+    cols = np.arange(x.shape[1])
+    last_w = w[np.maximum(count - 1, 0), cols]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pos = (cum - w) / (total - last_w)
+    pos[np.isnan(x)] = np.inf
+    out = np.full((len(qs), x.shape[1]), np.nan)
+    for row, q in enumerate(qs):
+        lo = np.clip((pos <= q).sum(axis=0) - 1, 0, np.maximum(count - 1, 0))
+        hi = np.minimum(lo + 1, np.maximum(count - 1, 0))
+        span = pos[hi, cols] - pos[lo, cols]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            frac = np.where(span > 0, (q - pos[lo, cols]) / span, 0.0)
+        out[row] = x[lo, cols] + np.clip(frac, 0.0, 1.0) * (x[hi, cols] - x[lo, cols])
+    single = count == 1
+    out[:, single] = x[0, single]
+    out[:, count == 0] = np.nan
+    return out
+
+
+def weighted_describe(df, columns, design):
+    """``describe()`` berbobot plus SE rata-rata berbasis desain, skew dan kurtosis.
+
+    ``count`` adalah jumlah baris (tidak berbobot); std, skew dan kurtosis
+    memakai koreksi bias yang sama dengan pandas, sehingga dengan bobot 1
+    hasilnya sama dengan ``describe_columns``. Desain tanpa baris aktif (bobot
+    tidak ada yang positif, atau stratum kosong semua) menghasilkan tabel NaN.
+    """
+    columns = list(columns)
+    if design.n == 0:
+        empty = dict.fromkeys(("mean", "se_mean", "std", "min", "25%", "50%", "75%", "max", "skew", "kurtosis"),
+                              np.nan)
+        return pd.DataFrame({"count": 0.0, "weight_sum": 0.0, **empty}, index=pd.Index(columns))
+    x = df[columns].to_numpy(dtype=np.float32, na_value=np.nan)[design.rows]
+    present = ~np.isnan(x)
+    wx = np.where(present, design.weights[:, None], np.float32(0))
+    n = present.sum(axis=0).astype(float)
+    sw = wx.sum(axis=0, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = np.where(present, wx * x, 0).sum(axis=0, dtype=np.float64) / sw
+        dev = np.where(present, x - mean, 0.0)
+        dev2 = dev * dev
+        m2 = (wx * dev2).sum(axis=0) / sw
+        m3 = (wx * dev2 * dev).sum(axis=0) / sw
+        m4 = (wx * dev2 * dev2).sum(axis=0) / sw
+        se = np.sqrt(linearized_variance(wx * dev / sw, design))
+        std = np.sqrt(np.where(n > 1, m2 * n / (n - 1), np.nan))
+        g1 = m3 / m2 ** 1.5
+        g2 = m4 / m2 ** 2 - 3.0
+        skew = np.where(n >= 3, np.sqrt(n * (n - 1)) / (n - 2) * g1, np.nan)
+        kurt = np.where(n >= 4, ((n + 1) * g2 + 6.0) * (n - 1) / ((n - 2) * (n - 3)), np.nan)
+    flat = m2 <= 1e-14 * np.maximum(mean ** 2, 1.0)
+    skew = np.where(flat & (n >= 3), 0.0, skew)
+    kurt = np.where(flat & (n >= 4), 0.0, kurt)
+    q1, q2, q3 = _weighted_quantiles(x, wx, (0.25, 0.5, 0.75))
+    has = n > 0
+    return pd.DataFrame({
+        "count": n,
+        "weight_sum": sw,
+        "mean": mean,
+        "se_mean": se,
+        "std": std,
+        "min": np.where(has, np.where(present, x, np.inf).min(axis=0, initial=np.inf), np.nan),
+        "25%": q1,
+        "50%": q2,
+        "75%": q3,
+        "max": np.where(has, np.where(present, x, -np.inf).max(axis=0, initial=-np.inf), np.nan),
+        "skew": skew,
+        "kurtosis": kurt,
+    }, index=pd.Index(columns))
+
+
+def weighted_crosstab_chi2(df, x1, x2, design, profiles=None):
+    """Tabel silang berbobot dan uji independensi Rao-Scott orde pertama.
+
+    Chi-Square Pearson dihitung dari proporsi berbobot dengan ukuran sampel
+    tak berbobot, lalu dibagi rata-rata design effect yang diperkirakan dari
+    varians desain proporsi sel dan margin (Rao & Scott, 1984).
+    """
+    codes1, labels1 = coded_column(df, x1, profiles)
+    codes2, labels2 = coded_column(df, x2, profiles)
+    a, b = codes1[design.rows], codes2[design.rows]
+    k1, k2 = len(labels1), len(labels2)
+    valid = (a >= 0) & (b >= 0)
+    w = design.weights[valid].astype(np.float64)
+    cell = a[valid].astype(np.int64) * k2 + b[valid]
+    totals = np.bincount(cell, weights=w, minlength=k1 * k2).reshape(k1, k2)
+    rows, cols = totals.sum(axis=1) > 0, totals.sum(axis=0) > 0
+    totals = totals[rows][:, cols]
+    r, c = totals.shape
+    # Kode ulang tanpa baris/kolom kosong; -1 = di luar domain
+    a = np.where(valid, (np.cumsum(rows) - 1)[a], -1)
+    b = np.where(valid, (np.cumsum(cols) - 1)[b], -1)
+    n = int(valid.sum())
+    grand = totals.sum()
+    index = pd.Index(labels1[rows], name=x1)
+    columns = pd.Index(labels2[cols], name=x2)
+    expected = np.outer(totals.sum(axis=1), totals.sum(axis=0)) / max(grand, 1e-300)
+    dof = (r - 1) * (c - 1) if r and c else 0
+    result = {
+        "table": pd.DataFrame(totals, index=index, columns=columns),
+        "expected": pd.DataFrame(expected, index=index, columns=columns),
+        "chi2": 0.0, "p": 1.0, "p_asymptotic": 1.0, "dof": int(dof), "cramers_v": np.nan,
+        "n": n, "weight_sum": float(grand), "deff": np.nan, "sparse": False, "test": TEST_RAO_SCOTT,
+    }
+    if dof == 0 or n == 0:
+        return result
+    p_cell = totals / grand
+    p_row, p_col = p_cell.sum(axis=1), p_cell.sum(axis=0)
+    indep = np.outer(p_row, p_col)
+    x2_pearson = float(n * ((p_cell - indep) ** 2 / indep).sum())
+
+    def deff(codes, k):
+        p, var = proportion_variance(codes, k, design)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            d = var / (p * (1.0 - p) / n)
+        return p, np.where(np.isfinite(d), d, 0.0)
+
+    p_ij, d_cell = deff(np.where((a >= 0) & (b >= 0), a * c + b, -1), r * c)
+    _, d_row = deff(np.where(b >= 0, a, -1), r)
+    _, d_col = deff(np.where(a >= 0, b, -1), c)
+    mean_deff = ((p_ij / indep.ravel() * (1.0 - p_ij) * d_cell).sum()
+                 - ((1.0 - p_row) * d_row).sum() - ((1.0 - p_col) * d_col).sum()) / dof
+    chi2 = x2_pearson / mean_deff if mean_deff > 0 else np.nan
+    p_value = float(stats.chi2.sf(chi2, dof)) if np.isfinite(chi2) else np.nan
+    result.update(
+        chi2=float(chi2),
+        p=p_value,
+        p_asymptotic=p_value,
+        cramers_v=float(np.sqrt(x2_pearson / (n * min(r - 1, c - 1)))),
+        deff=float(mean_deff),
+    )
+    return result
+
+
+def weighted_ranks(values, weights):
+    """Ranking berbobot (posisi tengah kumulatif bobot; nilai kembar dirata-rata)."""
+    uniques, inverse = np.unique(values, return_inverse=True)
+    tied = np.bincount(inverse, weights=weights, minlength=len(uniques))
+    return (np.cumsum(tied) - tied / 2.0)[inverse]
+
+
+def weighted_correlation(df, x1, x2, design, method=METHOD_PEARSON):
+    """Korelasi berbobot dengan SE berbasis desain dan p-value uji Wald.
+
+    SE diperoleh dari linearisasi (fungsi pengaruh korelasi Pearson,
+    ``x*y - r/2 * (x^2 + y^2)`` atas nilai terstandar). Untuk Spearman,
+    korelasi Pearson berbobot dihitung atas ranking berbobot.
+    """
+    x = df[x1].to_numpy(dtype=np.float32, na_value=np.nan)[design.rows]
+    y = df[x2].to_numpy(dtype=np.float32, na_value=np.nan)[design.rows]
+    keep = ~(np.isnan(x) | np.isnan(y))
+    w = design.weights[keep].astype(np.float64)
+    a, b = x[keep].astype(np.float64), y[keep].astype(np.float64)
+    if method == METHOD_SPEARMAN:
+        a, b = weighted_ranks(a, w), weighted_ranks(b, w)
+    elif method != METHOD_PEARSON:
+        raise ValueError(f"Metode korelasi tidak dikenal: {method!r}")
+    result = {"method": method, "coef": np.nan, "p": np.nan, "se": np.nan, "n": int(keep.sum())}
+    total = w.sum()
+    if result["n"] < 3 or total <= 0:
+        return result
+    da = a - (w * a).sum() / total
+    db = b - (w * b).sum() / total
+    saa, sbb, sab = (w * da * da).sum(), (w * db * db).sum(), (w * da * db).sum()
+    if saa <= 0 or sbb <= 0:
+        return result
+    coef = float(np.clip(sab / np.sqrt(saa * sbb), -1.0, 1.0))
+    za, zb = da / np.sqrt(saa / total), db / np.sqrt(sbb / total)
+    z = np.zeros((design.n, 1))
+    z[keep, 0] = w * (za * zb - coef / 2.0 * (za * za + zb * zb)) / total
+    se = float(np.sqrt(linearized_variance(z, design)[0]))
+    result.update(coef=coef, se=se)
+    if se > 0:
+        result["p"] = float(2.0 * stats.norm.sf(abs(coef) / se))
+    return result